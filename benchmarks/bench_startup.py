@@ -0,0 +1,105 @@
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "results" / "startup_baseline.json"
+
+# (디렉터리, 모듈, 모듈 import 시점에 로드되면 안 되는 무거운 의존성)
+ENTRY_POINTS = [
+    ("src", "news_alpha", ["feedparser", "openai"]),
+    ("kiwoom_bot", "kiwoom_mixed_bot", ["pandas", "yfinance", "requests"]),
+    ("etf_reporting", "etf_daily_report", ["yfinance", "pptx"]),
+    ("loan_default_analysis", "loan_default_analysis", ["matplotlib", "seaborn", "sklearn"]),
+]
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure(subdir: str, module: str):
+    cmd = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    proc = subprocess.run(cmd, cwd=ROOT / subdir, capture_output=True, text=True)
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"import {module} failed: {tail[0]}")
+
+    loaded = {}
+    for line in proc.stderr.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        if m:
+            loaded[m.group(4)] = int(m.group(2))
+    if module not in loaded:
+        raise RuntimeError(f"import {module}: no importtime entry")
+    return loaded[module] / 1000, loaded
+
+
+def run(repeat=5, tolerance=0.25, slack_ms=10.0, update=False, baseline_path=BASELINE_PATH):
+    # 기준선은 머신마다 다르므로 저장소에 두지 않는다. 없으면 조용히 만들지 않고 실패 처리 (--update로 명시적으로 생성)
+    baseline_path = Path(baseline_path)
+    baseline = {}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+
+    results = {}
+    failures = []
+    for subdir, module, forbidden in ENTRY_POINTS:
+        try:
+            samples = [measure(subdir, module) for _ in range(repeat)]
+        except RuntimeError as e:
+            failures.append(str(e))
+            print(f"[startup] {module:<24} ERROR {e}")
+            continue
+
+        # 콜드 스타트 노이즈를 줄이기 위해 최솟값 사용
+        best_ms = min(ms for ms, _ in samples)
+        loaded = samples[0][1]
+        results[module] = best_ms
+
+        status = "ok"
+        eager = [dep for dep in forbidden if dep in loaded]
+        if eager:
+            status = "EAGER"
+            failures.append(f"{module} imports {', '.join(eager)} at module load")
+
+        base = baseline.get(module)
+        if not update:
+            if base is None:
+                status = "NO BASELINE" if status == "ok" else status
+                failures.append(f"{module} has no baseline in {baseline_path} (run with --update on a reference build)")
+            elif best_ms > base * (1 + tolerance) + slack_ms:
+                status = "REGRESSED"
+                failures.append(f"{module} cold import {best_ms:.1f}ms > baseline {base:.1f}ms")
+
+        base_txt = "-" if base is None else f"{base:.1f}ms"
+        print(f"[startup] {module:<24} {best_ms:8.1f}ms  baseline {base_txt:>9}  {status}")
+
+    if update:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps({**baseline, **results}, indent=2), encoding="utf-8")
+        print(f"Baseline saved: {baseline_path}")
+
+    for f in failures:
+        print(f"FAIL: {f}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown vs baseline")
+    ap.add_argument("--slack-ms", type=float, default=10.0, help="Absolute slack added to the threshold")
+    ap.add_argument("--update", action="store_true", help="Write this run as the baseline (required on first use)")
+    ap.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline JSON (e.g. a CI cache path)")
+    args = ap.parse_args()
+    sys.exit(
+        run(
+            repeat=args.repeat,
+            tolerance=args.tolerance,
+            slack_ms=args.slack_ms,
+            update=args.update,
+            baseline_path=args.baseline,
+        )
+    )
@@ -0,0 +1,100 @@
+import sys
+import types
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from fixtures import make_ohlcv, make_rss_entries, make_ticker_info
+
+
+class CallLog:
+    def __init__(self):
+        self.calls = {}
+
+    def hit(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+
+def fake_feedparser(log: CallLog, entries_per_feed=30, seed=0):
+    mod = types.ModuleType("feedparser")
+
+    def parse(url, *args, **kwargs):
+        log.hit("feedparser.parse")
+        return SimpleNamespace(entries=make_rss_entries(url, entries_per_feed, seed), bozo=0)
+
+    mod.parse = parse
+    return mod
+
+
+def fake_yfinance(log: CallLog, n_days=126, seed=0):
+    mod = types.ModuleType("yfinance")
+
+    def download(tickers, *args, **kwargs):
+        log.hit("yf.download")
+        return make_ohlcv(tickers, n_days=n_days, seed=seed)
+
+    class Ticker:
+        def __init__(self, ticker):
+            self.ticker = ticker
+
+        @property
+        def info(self):
+            log.hit("yf.Ticker.info")
+            return make_ticker_info(self.ticker, seed=seed)
+
+    mod.download = download
+    mod.Ticker = Ticker
+    return mod
+
+
+def fake_requests(log: CallLog, status_code=200):
+    mod = types.ModuleType("requests")
+
+    def _response(name):
+        def call(url, *args, **kwargs):
+            log.hit(f"requests.{name}")
+            return SimpleNamespace(status_code=status_code, text='{"result": "ok"}', json=lambda: {"result": "ok"})
+
+        return call
+
+    mod.get = _response("get")
+    mod.post = _response("post")
+    mod.patch = _response("patch")
+    return mod
+
+
+def fake_openai(log: CallLog, reply="2"):
+    mod = types.ModuleType("openai")
+
+    class _Responses:
+        def create(self, model=None, input=None, **kwargs):
+            log.hit("openai.responses.create")
+            return SimpleNamespace(output_text=reply)
+
+    class OpenAI:
+        def __init__(self, *args, **kwargs):
+            self.responses = _Responses()
+
+    mod.OpenAI = OpenAI
+    return mod
+
+
+@contextmanager
+def fake_providers(entries_per_feed=30, n_days=126, seed=0):
+    # 엔트리 스크립트들은 외부 의존성을 함수 안에서 import 하므로 sys.modules 교체만으로 오프라인 실행된다
+    log = CallLog()
+    fakes = {
+        "feedparser": fake_feedparser(log, entries_per_feed, seed),
+        "yfinance": fake_yfinance(log, n_days, seed),
+        "requests": fake_requests(log),
+        "openai": fake_openai(log),
+    }
+    saved = {name: sys.modules.get(name) for name in fakes}
+    sys.modules.update(fakes)
+    try:
+        yield log
+    finally:
+        for name, mod in saved.items():
+            if mod is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = mod
@@ -0,0 +1,99 @@
+import zlib
+
+import numpy as np
+import pandas as pd
+
+ASOF = pd.Timestamp("2026-01-30")
+
+NEWS_KEYWORDS = ["Apple", "iPhone", "Microsoft", "Azure", "Nvidia", "AI chip", "Tesla", "EV", "Samsung", "memory chip", "Oil", "Fed"]
+NEWS_WORDS = ["beat", "surge", "growth", "record", "upgrade", "strong", "miss", "drop", "lawsuit", "probe", "downgrade", "weak", "flat"]
+
+LOAN_PROFESSIONS = [f"Profession_{i:02d}" for i in range(51)]
+LOAN_CITIES = [f"City_{i:03d}" for i in range(317)]
+LOAN_STATES = [f"State_{i:02d}" for i in range(29)]
+
+
+def _rng(seed, *keys):
+    # 같은 (seed, key) 조합이면 항상 같은 데이터
+    salt = zlib.crc32("|".join(map(str, keys)).encode("utf-8"))
+    return np.random.default_rng([seed, salt])
+
+
+def make_rss_entries(feed_url: str, n_entries=30, seed=0):
+    rng = _rng(seed, "rss", feed_url)
+    published = ASOF - pd.to_timedelta(rng.integers(0, 7 * 24 * 60, n_entries), unit="min")
+    entries = []
+    for i in range(n_entries):
+        kw = rng.choice(NEWS_KEYWORDS)
+        words = rng.choice(NEWS_WORDS, size=2, replace=False)
+        entries.append(
+            {
+                "title": f"{kw} shares {words[0]} after quarterly update #{i}",
+                "summary": f"<p>{kw} reported <b>{words[1]}</b> demand.</p><a href='#'>more</a>",
+                "link": f"{feed_url}/article/{i}",
+                "published": published[i].strftime("%a, %d %b %Y %H:%M:%S +0000"),
+            }
+        )
+    return entries
+
+
+def make_ohlcv(tickers, n_days=126, seed=0):
+    # yf.download(..., group_by 기본값)과 같은 (field, ticker) MultiIndex 컬럼
+    if isinstance(tickers, str):
+        tickers = [tickers]
+    idx = pd.bdate_range(end=ASOF, periods=n_days, name="Date")
+    frames = {}
+    for t in tickers:
+        rng = _rng(seed, "ohlcv", t)
+        close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, n_days)))
+        open_ = close * (1 + rng.normal(0, 0.004, n_days))
+        high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.006, n_days)))
+        low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.006, n_days)))
+        volume = rng.integers(100_000, 50_000_000, n_days).astype(float)
+        frames[t] = pd.DataFrame(
+            {"Adj Close": close, "Close": close, "High": high, "Low": low, "Open": open_, "Volume": volume},
+            index=idx,
+        )
+    df = pd.concat(frames, axis=1).swaplevel(0, 1, axis=1).sort_index(axis=1)
+    df.columns.names = ["Price", "Ticker"]
+    return df
+
+
+def make_ticker_info(ticker: str, seed=0):
+    rng = _rng(seed, "info", ticker)
+    return {
+        "trailingPE": float(rng.uniform(8, 40)),
+        "expenseRatio": float(rng.uniform(0.0003, 0.0075)),
+        "ytdReturn": float(rng.normal(0.03, 0.08)),
+    }
+
+
+def make_loan_table(n_rows=10_000, seed=0) -> pd.DataFrame:
+    # `Training Data.csv`와 같은 컬럼/타입, 약 12% 연체 비율
+    rng = _rng(seed, "loan", n_rows)
+    age = rng.integers(21, 80, n_rows)
+    experience = rng.integers(0, 21, n_rows)
+    income = rng.integers(10_000, 10_000_000, n_rows)
+    job_yrs = np.minimum(experience, rng.integers(0, 15, n_rows))
+    house_yrs = rng.integers(10, 15, n_rows)
+
+    logit = -2.0 - 0.02 * (age - 50) - 0.05 * (experience - 10) - 1e-7 * (income - 5_000_000)
+    risk = (rng.random(n_rows) < 1 / (1 + np.exp(-logit))).astype(int)
+
+    return pd.DataFrame(
+        {
+            "Id": np.arange(1, n_rows + 1),
+            "Income": income,
+            "Age": age,
+            "Experience": experience,
+            "Married/Single": rng.choice(["single", "married"], n_rows, p=[0.9, 0.1]),
+            "House_Ownership": rng.choice(["rented", "owned", "norent_noown"], n_rows, p=[0.92, 0.05, 0.03]),
+            "Car_Ownership": rng.choice(["no", "yes"], n_rows, p=[0.7, 0.3]),
+            "Profession": rng.choice(LOAN_PROFESSIONS, n_rows),
+            "CITY": rng.choice(LOAN_CITIES, n_rows),
+            "STATE": rng.choice(LOAN_STATES, n_rows),
+            "CURRENT_JOB_YRS": job_yrs,
+            "CURRENT_HOUSE_YRS": house_yrs,
+            "Risk_Flag": risk,
+        }
+    )
@@ -0,0 +1,247 @@
+import argparse
+import contextlib
+import datetime as dt
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+HISTORY_PATH = BENCH_DIR / "results" / "history.jsonl"
+
+for sub in ("src", "kiwoom_bot", "etf_reporting", "loan_default_analysis"):
+    sys.path.insert(0, str(ROOT / sub))
+
+from fakes import fake_providers  # noqa: E402
+from fixtures import make_loan_table  # noqa: E402
+
+SCALES = {
+    "news": {"small": 2, "medium": 20, "large": 200},  # RSS 피드 수 (피드당 30건)
+    "bot": {"small": 5, "medium": 50, "large": 200},  # 티커 수
+    "etf": {"small": 30, "medium": 100, "large": 300},  # ETF 유니버스 크기
+    "loan": {"small": 2_000, "medium": 20_000, "large": 100_000},  # 학습 데이터 행 수
+}
+
+
+@contextlib.contextmanager
+def workdir():
+    prev = os.getcwd()
+    tmp = Path(tempfile.mkdtemp(prefix="bench_"))
+    os.chdir(tmp)
+    try:
+        yield tmp
+    finally:
+        os.chdir(prev)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def patched(obj, **attrs):
+    saved = {k: getattr(obj, k) for k in attrs}
+    for k, v in attrs.items():
+        setattr(obj, k, v)
+    try:
+        yield
+    finally:
+        for k, v in saved.items():
+            setattr(obj, k, v)
+
+
+@contextlib.contextmanager
+def env(**values):
+    saved = {k: os.environ.get(k) for k in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def run_rounds(fn, setup=None, rounds=3):
+    times = []
+    for r in range(rounds):
+        if setup:
+            setup(r)
+        with contextlib.redirect_stdout(io.StringIO()):
+            t0 = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - t0)
+    return {
+        "min": min(times),
+        "mean": statistics.fmean(times),
+        "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "rounds": len(times),
+    }
+
+
+def bench_news(n, rounds, use_llm=False):
+    import feature_store
+    import news_alpha
+
+    feeds = [f"https://feeds.example.com/news/{i}" for i in range(n)]
+    with workdir() as tmp, fake_providers() as log, patched(news_alpha, RSS_FEEDS=feeds), patched(
+        feature_store, DEFAULT_PATH=str(tmp / "feature_store.db")
+    ):
+        stats = run_rounds(lambda: news_alpha.main(use_llm=use_llm), rounds=rounds)
+    return stats, log.calls
+
+
+def bench_bot(n, rounds):
+    import feature_store
+    import kiwoom_mixed_bot as bot
+
+    with workdir() as tmp, fake_providers() as log:
+        db_path, cfg_path = tmp / "kiwoom_bot.db", tmp / "kiwoom_bot_config.json"
+        cfg = {
+            "tickers": [f"{i:06d}.KS" for i in range(n)],
+            "max_position_count": 3,
+            "max_order_pct": 0.10,
+            "daily_loss_limit_pct": 0.03,
+            "starting_cash": 10000000,
+            "simulate_only": True,
+            "news_weight": 0.5,
+            "news_max_age_hours": 24,
+        }
+        cfg_path.write_text(json.dumps(cfg), encoding="utf-8")
+        with feature_store.FeatureStore(str(tmp / "feature_store.db")) as store:
+            run_ts = feature_store.utc_ts()
+            store.put_many(
+                row
+                for i, t in enumerate(cfg["tickers"])
+                for row in (
+                    (t, "news_score", run_ts, float(i % 7 - 3) * 4),
+                    (t, "news_count", run_ts, 4.0),
+                    (t, "news_mean", run_ts, float(i % 7 - 3)),
+                )
+            )
+
+        def setup(_):
+            db_path.unlink(missing_ok=True)
+
+        with patched(bot, DB_PATH=str(db_path), CONFIG_PATH=str(cfg_path)), patched(
+            feature_store, DEFAULT_PATH=str(tmp / "feature_store.db")
+        ), env(
+            KIWOOM_ACCESS_TOKEN="bench", KIWOOM_ORDER_URL="https://kiwoom.example.com/order"
+        ):
+            stats = run_rounds(bot.run_once, setup=setup, rounds=rounds)
+    return stats, log.calls
+
+
+def bench_etf(n, rounds):
+    import etf_daily_report as etf
+
+    universe = [f"ETF{i:03d}" for i in range(n)]
+    with workdir() as tmp, fake_providers() as log:
+        with patched(etf, ETF_UNIVERSE=universe, DB_PATH=tmp / "etf.db", PPT_OUTPUT_DIR=tmp / "ppt"):
+            stats = run_rounds(etf.main, rounds=rounds)
+    return stats, log.calls
+
+
+def bench_loan(n, rounds):
+    import loan_default_analysis as lda
+
+    with workdir() as tmp, fake_providers() as log:
+        data = tmp / "Training Data.csv"
+        make_loan_table(n).to_csv(data, index=False)
+        # 라운드마다 새 캐시 디렉터리를 써서 콜드 학습 시간을 측정
+        stats = run_rounds(
+            lambda: lda.main(
+                str(data),
+                cv_folds=3,
+                plots="none",
+                out_dir=str(tmp / "outputs"),
+                cache_dir=str(tmp / f"cache_{time.perf_counter_ns()}"),
+            ),
+            rounds=rounds,
+        )
+    return stats, log.calls
+
+
+SUITES = {
+    "news": bench_news,
+    "news_llm": lambda n, rounds: bench_news(n, rounds, use_llm=True),
+    "bot": bench_bot,
+    "etf": bench_etf,
+    "loan": bench_loan,
+}
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def load_history():
+    if not HISTORY_PATH.exists():
+        return []
+    with open(HISTORY_PATH, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main(suites, scales, rounds=3, save=True):
+    history = load_history()
+    commit = git_commit()
+    records = []
+
+    for suite in suites:
+        for scale in scales:
+            n = SCALES[suite.split("_")[0]][scale]
+            try:
+                stats, calls = SUITES[suite](n, rounds)
+            except ImportError as e:
+                print(f"[bench] {suite:<9} {scale:<7} SKIP ({e})")
+                continue
+
+            prev = next((h for h in reversed(history) if h["suite"] == suite and h["scale"] == scale), None)
+            delta = ""
+            if prev:
+                delta = f"{(stats['min'] / prev['min'] - 1) * 100:+.1f}% vs {prev.get('commit') or 'prev'}"
+            print(
+                f"[bench] {suite:<9} {scale:<7} n={n:<7} min {stats['min']:.3f}s  "
+                f"mean {stats['mean']:.3f}s ±{stats['stddev']:.3f}  {delta}"
+            )
+            records.append(
+                {
+                    "ts": dt.datetime.now().isoformat(timespec="seconds"),
+                    "commit": commit,
+                    "python": platform.python_version(),
+                    "suite": suite,
+                    "scale": scale,
+                    "n": n,
+                    **stats,
+                    "calls": calls,
+                }
+            )
+
+    if save and records:
+        HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(HISTORY_PATH, "a", encoding="utf-8") as f:
+            for r in records:
+                f.write(json.dumps(r, ensure_ascii=False) + "\n")
+        print(f"History appended: {HISTORY_PATH}")
+    return records
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--suite", nargs="+", default=list(SUITES), choices=list(SUITES))
+    ap.add_argument("--scale", nargs="+", default=["small", "medium"], choices=["small", "medium", "large"])
+    ap.add_argument("--rounds", type=int, default=3)
+    ap.add_argument("--no-save", action="store_true", help="Do not append to results/history.jsonl")
+    args = ap.parse_args()
+    main(args.suite, args.scale, rounds=args.rounds, save=not args.no_save)
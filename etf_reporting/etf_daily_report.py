@@ -1,13 +1,20 @@
 import os
+import sys
 import sqlite3
 import datetime as dt
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
-from pptx import Presentation
-from pptx.util import Inches, Pt
+
+try:
+    import instrumentation as metrics
+except ImportError:
+    # 저장소 레이아웃에서 실행하면 공용 모듈은 ../src 에 있다
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+    import instrumentation as metrics
+
+# yfinance/pptx는 무겁기 때문에 실제 사용 시점에 import
 
 DB_PATH = Path(os.getenv("ETF_DB_PATH", "C:/Users/bobi/.openclaw/workspace/etf_analytics.db"))
 PPT_OUTPUT_DIR = Path(os.getenv(
@@ -51,8 +58,12 @@ def ensure_db(conn: sqlite3.Connection):
     conn.commit()
 
 
+@metrics.timed("fetch_prices")
 def fetch_prices(tickers):
+    import yfinance as yf
+
     df = yf.download(tickers, period="6mo", interval="1d", auto_adjust=False, progress=False)
+    metrics.incr("external_calls_total", service="yfinance")
     if isinstance(df.columns, pd.MultiIndex):
         return df
     raise RuntimeError("가격 데이터 형식이 예상과 다릅니다.")
@@ -86,7 +97,10 @@ def pick_top10_by_dollar_volume(px_multi: pd.DataFrame):
     return [x[0] for x in rows[:10]], {k: v for k, v in rows}
 
 
+@metrics.timed("collect_metrics")
 def collect_metrics(top10, px_multi, avg_dv_map):
+    import yfinance as yf
+
     out = []
     asof = None
 
@@ -108,7 +122,9 @@ def collect_metrics(top10, px_multi, avg_dv_map):
         macd = (ema12 - ema26).iloc[-1]
         macd_sig = (ema12 - ema26).ewm(span=9, adjust=False).mean().iloc[-1]
 
-        info = yf.Ticker(t).info or {}
+        with metrics.span("ticker_info"):
+            info = yf.Ticker(t).info or {}
+        metrics.incr("external_calls_total", service="yfinance_info")
         pe = info.get("trailingPE")
         exp = info.get("annualReportExpenseRatio") or info.get("expenseRatio")
         ytd = info.get("ytdReturn")
@@ -137,6 +153,7 @@ def collect_metrics(top10, px_multi, avg_dv_map):
     return pd.DataFrame(out)
 
 
+@metrics.timed("upsert_db")
 def upsert_db(conn: sqlite3.Connection, df: pd.DataFrame):
     if df.empty:
         return
@@ -173,7 +190,11 @@ def make_signal(row):
     return "중립"
 
 
+@metrics.timed("build_ppt")
 def build_ppt(df: pd.DataFrame):
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+
     PPT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     out_path = PPT_OUTPUT_DIR / PPT_NAME
 
@@ -246,4 +267,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with metrics.run("etf_daily_report"):
+        main()
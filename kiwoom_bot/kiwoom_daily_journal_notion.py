@@ -2,7 +2,6 @@ import os
 import sqlite3
 import datetime as dt
 from zoneinfo import ZoneInfo
-import requests
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "kiwoom_bot.db")
 PAGE_ID = "30f74643-ea79-800e-8202-c4bb44404676"
@@ -60,6 +59,8 @@ def main():
     ).fetchall()
     conn.close()
 
+    import requests
+
     blocks = to_blocks(today, rows)
     headers = {
         "Authorization": f"Bearer {TOKEN}",
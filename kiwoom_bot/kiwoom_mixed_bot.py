@@ -1,18 +1,42 @@
+from __future__ import annotations
+
 import os
+import sys
 import json
 import sqlite3
 import datetime as dt
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
-import pandas as pd
-import yfinance as yf
-import requests
+# 저장소 레이아웃에서 실행하면 공용 모듈은 ../src 에 있다
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+try:
+    import instrumentation as metrics
+except ImportError:
+    sys.path.append(SRC_DIR)
+    import instrumentation as metrics
+
+# pandas/yfinance/requests는 실제로 쓰는 경로에서만 import (손실 가드 조기 종료 시 로드하지 않음)
+if TYPE_CHECKING:
+    import pandas as pd
 
 KST = ZoneInfo("Asia/Seoul")
 DB_PATH = os.path.join(os.path.dirname(__file__), "kiwoom_bot.db")
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "kiwoom_bot_config.json")
 
 
+def load_feature_store():
+    # news_weight를 켤 때만 필요 (instrumentation.py만 복사한 단독 실행도 기본 설정으로 동작)
+    try:
+        from feature_store import FeatureStore
+    except ImportError:
+        if SRC_DIR not in sys.path:
+            sys.path.append(SRC_DIR)
+        from feature_store import FeatureStore
+    return FeatureStore
+
+
 def load_config():
     if not os.path.exists(CONFIG_PATH):
         cfg = {
@@ -22,6 +46,8 @@ def load_config():
             "daily_loss_limit_pct": 0.03,
             "starting_cash": 10000000,
             "simulate_only": True,
+            "news_weight": 0.0,
+            "news_max_age_hours": 24,
         }
         with open(CONFIG_PATH, "w", encoding="utf-8") as f:
             json.dump(cfg, f, ensure_ascii=False, indent=2)
@@ -100,8 +126,14 @@ def rsi(series: pd.Series, period=14):
     return 100 - 100 / (1 + rs)
 
 
-def signal_for_ticker(ticker: str):
-    df = yf.download(ticker, period="6mo", interval="1d", progress=False, auto_adjust=False)
+@metrics.timed("signal_for_ticker")
+def signal_for_ticker(ticker: str, news_score: float | None = None, news_weight: float = 0.0):
+    import pandas as pd
+    import yfinance as yf
+
+    with metrics.span("yf_download"):
+        df = yf.download(ticker, period="6mo", interval="1d", progress=False, auto_adjust=False)
+    metrics.incr("external_calls_total", service="yfinance")
     if df.empty:
         return None
     if isinstance(df.columns, pd.MultiIndex):
@@ -144,6 +176,10 @@ def signal_for_ticker(ticker: str):
         score -= 1
         reasons.append("RSI 과열권(차익실현 우호)")
 
+    if news_score is not None and news_weight:
+        score += news_weight * news_score
+        reasons.append(f"뉴스 감성 {news_score:+.1f} (가중치 {news_weight:g})")
+
     side = "HOLD"
     if score >= 2:
         side = "BUY"
@@ -159,13 +195,17 @@ def signal_for_ticker(ticker: str):
     }
 
 
+@metrics.timed("place_order")
 def place_order_mock_or_kiwoom(side, ticker, qty, price):
     token = os.getenv("KIWOOM_ACCESS_TOKEN", "")
     order_url = os.getenv("KIWOOM_ORDER_URL", "")
 
     if not token or not order_url:
+        metrics.incr("orders_total", source="SIM", side=side)
         return {"source": "SIM", "status": "FILLED"}
 
+    import requests
+
     # 실제 키움 주문 엔드포인트/필드는 사용자 문서값으로 교체 필요
     payload = {
         "side": side,
@@ -177,12 +217,16 @@ def place_order_mock_or_kiwoom(side, ticker, qty, price):
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json;charset=UTF-8",
     }
+    metrics.incr("external_calls_total", service="kiwoom")
     try:
         r = requests.post(order_url, json=payload, headers=headers, timeout=15)
         if r.status_code < 300:
+            metrics.incr("orders_total", source="KIWOOM", side=side)
             return {"source": "KIWOOM", "status": "FILLED", "raw": r.text[:200]}
+        metrics.incr("external_errors_total", service="kiwoom", reason=str(r.status_code))
         return {"source": "KIWOOM", "status": f"ERROR_{r.status_code}", "raw": r.text[:200]}
     except Exception as e:
+        metrics.incr("external_errors_total", service="kiwoom", reason="exception")
         return {"source": "KIWOOM", "status": f"EXCEPTION:{e}"}
 
 
@@ -206,16 +250,30 @@ def run_once():
         elif s == "BUY":
             realized -= float(amt)
     if realized < -cfg["starting_cash"] * float(cfg["daily_loss_limit_pct"]):
+        metrics.incr("loss_guard_total")
         print("[GUARD] 일일 손실한도 초과로 거래 중지")
         return
 
     positions = {r[0]: {"qty": float(r[1]), "avg": float(r[2])} for r in conn.execute("SELECT ticker, qty, avg_price FROM portfolio").fetchall()}
 
+    # 뉴스 감성 항: news_alpha가 피처 스토어에 기록한 최신 news_mean(기사 평균, -3~3)을 티커당 인덱스 조회 1회로 읽는다
+    news_weight = float(cfg.get("news_weight", 0.0))
+    news_scores = {}
+    if news_weight:
+        FeatureStore = load_feature_store()
+        max_age = cfg.get("news_max_age_hours", 24)
+        with FeatureStore() as store:
+            for t in cfg["tickers"]:
+                row = store.latest(t, "news_mean", max_age_hours=max_age)
+                if row is not None:
+                    news_scores[t] = row[0]
+
     candidates = []
-    for t in cfg["tickers"]:
-        sig = signal_for_ticker(t)
-        if sig:
-            candidates.append(sig)
+    with metrics.span("signals", tickers=len(cfg["tickers"])):
+        for t in cfg["tickers"]:
+            sig = signal_for_ticker(t, news_scores.get(t), news_weight)
+            if sig:
+                candidates.append(sig)
 
     # prioritize strongest signals
     candidates.sort(key=lambda x: abs(x["score"]), reverse=True)
@@ -274,4 +332,5 @@ def run_once():
 
 
 if __name__ == "__main__":
-    run_once()
+    with metrics.run("kiwoom_mixed_bot"):
+        run_once()
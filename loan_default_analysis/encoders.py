@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import sklearn
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.feature_extraction import FeatureHasher
+from sklearn.impute import SimpleImputer
+from sklearn.model_selection import StratifiedKFold
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, TargetEncoder
+
+ENCODING_STRATEGIES = ("onehot", "onehot_capped", "ordinal", "target", "hashing")
+
+DEFAULT_ENCODING_PARAMS = {
+    "min_frequency": 20,
+    "max_categories": 50,
+    "n_features": 256,
+}
+
+
+class HashingEncoder(BaseEstimator, TransformerMixin):
+    # 컬럼=값 토큰을 고정 크기 희소 벡터로 해싱 (카테고리 사전 없이 차원 고정)
+    def __init__(self, n_features=256):
+        self.n_features = n_features
+
+    def fit(self, X, y=None):
+        X = np.asarray(X)
+        self.n_features_in_ = X.shape[1]
+        return self
+
+    def transform(self, X):
+        X = np.asarray(X, dtype=str)
+        hasher = FeatureHasher(n_features=self.n_features, input_type="string", alternate_sign=False)
+        tokens = ([f"{j}={v}" for j, v in enumerate(row)] for row in X)
+        return hasher.transform(tokens)
+
+    def get_feature_names_out(self, input_features=None):
+        return np.array([f"hash_{i}" for i in range(self.n_features)], dtype=object)
+
+
+def _target_encoder():
+    # sklearn 1.9부터 random_state 대신 cv 분할기로 셔플을 고정한다
+    if tuple(int(x) for x in sklearn.__version__.split(".")[:2]) >= (1, 9):
+        return TargetEncoder(target_type="binary", cv=StratifiedKFold(5, shuffle=True, random_state=42))
+    return TargetEncoder(target_type="binary", random_state=42)
+
+
+def make_categorical_encoder(strategy: str, params: dict = None):
+    p = {**DEFAULT_ENCODING_PARAMS, **(params or {})}
+    if strategy == "onehot":
+        enc = OneHotEncoder(handle_unknown="ignore")
+    elif strategy == "onehot_capped":
+        enc = OneHotEncoder(
+            handle_unknown="infrequent_if_exist",
+            min_frequency=p["min_frequency"],
+            max_categories=p["max_categories"],
+        )
+    elif strategy == "ordinal":
+        # 트리 모델 전용: 카테고리당 1개 정수 컬럼
+        enc = OrdinalEncoder(handle_unknown="use_encoded_value", unknown_value=-1)
+    elif strategy == "target":
+        # 교차 적합(cross fitting)으로 타깃 누수 방지
+        enc = _target_encoder()
+    elif strategy == "hashing":
+        enc = HashingEncoder(n_features=p["n_features"])
+    else:
+        raise ValueError(f"Unknown encoding strategy: {strategy} (choose from {', '.join(ENCODING_STRATEGIES)})")
+
+    return Pipeline(
+        steps=[
+            ("imputer", SimpleImputer(strategy="most_frequent")),
+            (strategy, enc),
+        ]
+    )
+
+
+def load_encoding_config(path):
+    # {"default": "onehot", "columns": {"CITY": "hashing"}, "params": {"n_features": 512}}
+    if not path:
+        return None
+    with open(Path(path), "r", encoding="utf-8") as f:
+        cfg = json.load(f)
+    strategies = [cfg.get("default", "onehot"), *cfg.get("columns", {}).values()]
+    for s in strategies:
+        if s not in ENCODING_STRATEGIES:
+            raise ValueError(f"Unknown encoding strategy in {path}: {s}")
+    return cfg
@@ -1,28 +1,17 @@
 import argparse
+import math
+import time
+from datetime import datetime
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-from sklearn.model_selection import train_test_split
-from sklearn.compose import ColumnTransformer
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
-from sklearn.impute import SimpleImputer
-from sklearn.metrics import (
-    accuracy_score,
-    precision_score,
-    recall_score,
-    f1_score,
-    roc_auc_score,
-    confusion_matrix,
-    RocCurveDisplay,
-)
-from sklearn.linear_model import LogisticRegression
-from sklearn.tree import DecisionTreeClassifier
-from sklearn.ensemble import RandomForestClassifier
+import joblib
+from joblib import Memory, Parallel, delayed, effective_n_jobs
+
+from report import feature_importances, launch_background, render_report, save_report_inputs
+
+# sklearn(및 sklearn 기반 encoders)은 쓰는 함수 안에서 import: `--help`나 모듈 import만으로는 로드하지 않는다
 
 
 def load_data(path: Path) -> pd.DataFrame:
@@ -30,7 +19,14 @@ def load_data(path: Path) -> pd.DataFrame:
     return df
 
 
-def build_preprocessor(df: pd.DataFrame, target_col: str):
+def build_preprocessor(df: pd.DataFrame, target_col: str, encoding: dict = None):
+    from sklearn.compose import ColumnTransformer
+    from sklearn.impute import SimpleImputer
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    from encoders import make_categorical_encoder
+
     feature_cols = [c for c in df.columns if c != target_col]
 
     if "Id" in feature_cols:
@@ -48,64 +44,389 @@ def build_preprocessor(df: pd.DataFrame, target_col: str):
         ]
     )
 
-    categorical_transformer = Pipeline(
-        steps=[
-            ("imputer", SimpleImputer(strategy="most_frequent")),
-            ("onehot", OneHotEncoder(handle_unknown="ignore")),
-        ]
-    )
+    # 컬럼별 인코딩 전략 (기본: 원-핫). 같은 전략의 컬럼끼리 하나의 변환기로 묶는다
+    encoding = encoding or {}
+    default_strategy = encoding.get("default", "onehot")
+    column_strategy = encoding.get("columns", {})
+    groups = {}
+    for c in categorical_features:
+        groups.setdefault(column_strategy.get(c, default_strategy), []).append(c)
+
+    transformers = [("num", numeric_transformer, numeric_features)]
+    for strategy, cols in groups.items():
+        name = "cat" if strategy == "onehot" else f"cat_{strategy}"
+        transformers.append((name, make_categorical_encoder(strategy, encoding.get("params")), cols))
 
     preprocessor = ColumnTransformer(
-        transformers=[
-            ("num", numeric_transformer, numeric_features),
-            ("cat", categorical_transformer, categorical_features),
-        ]
+        transformers=transformers,
+        # 원-핫 결과는 항상 CSR로 유지 (대용량 배치 스코어링 시 메모리 상한)
+        sparse_threshold=1.0,
     )
 
     return X, preprocessor
 
 
+def score_predictions(y_true, pred, prob):
+    from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score, roc_auc_score
+
+    return {
+        "accuracy": accuracy_score(y_true, pred),
+        "precision": precision_score(y_true, pred, zero_division=0),
+        "recall": recall_score(y_true, pred, zero_division=0),
+        "f1": f1_score(y_true, pred, zero_division=0),
+        "roc_auc": roc_auc_score(y_true, prob) if prob is not None else np.nan,
+    }
+
+
+def predict_with_proba(model, X):
+    # 확률을 한 번만 계산하고 라벨은 argmax로 유도 (전처리/추론 중복 방지)
+    if hasattr(model, "predict_proba"):
+        proba = model.predict_proba(X)
+        pred = model.classes_[proba.argmax(axis=1)]
+        return pred, proba[:, 1]
+    return model.predict(X), None
+
+
 def evaluate_model(name, model, X_train, X_test, y_train, y_test):
+    t0 = time.perf_counter()
     model.fit(X_train, y_train)
-    pred = model.predict(X_test)
-    prob = model.predict_proba(X_test)[:, 1] if hasattr(model, "predict_proba") else None
-
-    metrics = {
-        "model": name,
-        "accuracy": accuracy_score(y_test, pred),
-        "precision": precision_score(y_test, pred, zero_division=0),
-        "recall": recall_score(y_test, pred, zero_division=0),
-        "f1": f1_score(y_test, pred, zero_division=0),
-        "roc_auc": roc_auc_score(y_test, prob) if prob is not None else np.nan,
-    }
+    fit_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    pred, prob = predict_with_proba(model, X_test)
+    predict_time = time.perf_counter() - t0
+
+    metrics = {"model": name, **score_predictions(y_test, pred, prob)}
+    metrics["fit_time"] = fit_time
+    metrics["predict_time"] = predict_time
 
     return model, metrics, pred, prob
 
 
-def main(data_path: str):
-    sns.set_theme(style="darkgrid")
+def make_pipeline(preprocessor, clf, memory=None):
+    from sklearn.base import clone
+    from sklearn.pipeline import Pipeline
 
-    data_file = Path(data_path)
-    if not data_file.exists():
-        raise FileNotFoundError(f"Data file not found: {data_file}")
+    # memory가 주어지면 동일 데이터에 대한 전처리 fit 결과를 모델 간에 재사용
+    return Pipeline(steps=[("preprocess", clone(preprocessor)), ("model", clone(clf))], memory=memory)
 
-    out_dir = Path(__file__).resolve().parent / "outputs"
-    out_dir.mkdir(parents=True, exist_ok=True)
 
-    df = load_data(data_file)
+def _transform_fold(preprocessor, X, y, train_idx, test_idx):
+    from sklearn.base import clone
 
-    target_col = "Risk_Flag"
-    if target_col not in df.columns:
-        raise ValueError("`Risk_Flag` column is required in dataset")
+    pre = clone(preprocessor)
+    t0 = time.perf_counter()
+    Xt_train = pre.fit_transform(X.iloc[train_idx], y.iloc[train_idx])
+    Xt_test = pre.transform(X.iloc[test_idx])
+    return Xt_train, Xt_test, time.perf_counter() - t0
 
-    y = df[target_col].astype(int)
-    X, preprocessor = build_preprocessor(df, target_col)
 
-    X_train, X_test, y_train, y_test = train_test_split(
+def _fit_fold(name, fold, clf, Xt_train, Xt_test, y_train, y_test, preprocess_time):
+    from sklearn.base import clone
+
+    _, metrics, _, _ = evaluate_model(name, clone(clf), Xt_train, Xt_test, y_train, y_test)
+    metrics["fold"] = fold
+    metrics["preprocess_time"] = preprocess_time
+    return metrics
+
+
+def cross_validate_models(models, preprocessor, X, y, n_splits=5, n_jobs=-1, random_state=42):
+    from sklearn.base import clone
+    from sklearn.model_selection import StratifiedKFold
+
+    skf = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    folds = list(skf.split(X, y))
+
+    if effective_n_jobs(n_jobs) > 1:
+        # 바깥 루프가 코어를 쓰므로 모델 내부 병렬(RandomForest n_jobs)은 끈다
+        models = {
+            name: clone(clf).set_params(n_jobs=1) if clf.get_params().get("n_jobs") not in (None, 1) else clf
+            for name, clf in models.items()
+        }
+
+    with Parallel(n_jobs=n_jobs) as parallel:
+        # 전처리는 폴드당 한 번만 fit/transform 하고, 변환된 행렬을 모든 모델이 공유
+        transformed = parallel(
+            delayed(_transform_fold)(preprocessor, X, y, train_idx, test_idx) for train_idx, test_idx in folds
+        )
+        # 분류기 fit만 모델 x 폴드 조합으로 병렬 실행
+        results = parallel(
+            delayed(_fit_fold)(name, i, clf, Xt_train, Xt_test, y.iloc[tr], y.iloc[te], preprocess_time)
+            for i, ((tr, te), (Xt_train, Xt_test, preprocess_time)) in enumerate(zip(folds, transformed))
+            for name, clf in models.items()
+        )
+    return pd.DataFrame(results)
+
+
+def summarize_cv(cv_df: pd.DataFrame) -> pd.DataFrame:
+    value_cols = ["accuracy", "precision", "recall", "f1", "roc_auc", "preprocess_time", "fit_time", "predict_time"]
+    agg = cv_df.groupby("model")[value_cols].agg(["mean", "std"])
+    agg.columns = [f"{col}_{stat}" for col, stat in agg.columns]
+    agg = agg.reset_index().sort_values("roc_auc_mean", ascending=False)
+    return agg
+
+
+def format_cv_summary(summary: pd.DataFrame) -> pd.DataFrame:
+    out = pd.DataFrame({"model": summary["model"]})
+    for col in ["accuracy", "precision", "recall", "f1", "roc_auc"]:
+        out[col] = [f"{m:.4f}±{s:.4f}" for m, s in zip(summary[f"{col}_mean"], summary[f"{col}_std"])]
+    for col in ["preprocess_time", "fit_time", "predict_time"]:
+        out[col] = [f"{m:.2f}s±{s:.2f}" for m, s in zip(summary[f"{col}_mean"], summary[f"{col}_std"])]
+    return out
+
+
+def export_model(pipe, name, feature_cols, metrics, model_dir: Path) -> Path:
+    import sklearn
+
+    model_dir.mkdir(parents=True, exist_ok=True)
+    version = datetime.now().strftime("%Y%m%d_%H%M%S")
+    pipe.set_params(memory=None)
+
+    bundle = {
+        "version": version,
+        "model_name": name,
+        "features": list(feature_cols),
+        "metrics": {k: (float(v) if isinstance(v, (int, float, np.number)) else v) for k, v in metrics.items()},
+        "sklearn_version": sklearn.__version__,
+        "pipeline": pipe,
+    }
+    path = model_dir / f"loan_risk_{version}.joblib"
+    joblib.dump(bundle, path)
+    (model_dir / "LATEST").write_text(path.name, encoding="utf-8")
+    return path
+
+
+def search_space():
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.tree import DecisionTreeClassifier
+
+    # 탐색 시에는 바깥 루프가 모든 코어를 쓰므로 모델 내부 병렬은 끈다
+    return {
+        "LogisticRegression": (
+            LogisticRegression(max_iter=2000, class_weight="balanced"),
+            {"C": [0.01, 0.1, 1.0, 10.0]},
+        ),
+        "DecisionTree": (
+            DecisionTreeClassifier(random_state=42),
+            {"max_depth": [4, 6, 8, 12, 16, None], "min_samples_leaf": [1, 5, 20, 50]},
+        ),
+        "RandomForest": (
+            RandomForestClassifier(random_state=42, n_jobs=1, class_weight="balanced_subsample"),
+            {
+                "n_estimators": [50, 100, 200, 300],
+                "max_depth": [6, 10, 16, None],
+                "min_samples_leaf": [1, 5, 10, 20],
+                "max_features": ["sqrt", 0.5],
+            },
+        ),
+    }
+
+
+def _stratified_subsample(y, n, random_state):
+    from sklearn.model_selection import train_test_split
+
+    if n >= len(y):
+        return np.arange(len(y))
+    idx, _ = train_test_split(np.arange(len(y)), train_size=n, stratify=y, random_state=random_state)
+    return np.sort(idx)
+
+
+def _transform_split(preprocessor, X_train, y_train, X_val):
+    from sklearn.base import clone
+
+    pre = clone(preprocessor)
+    t0 = time.perf_counter()
+    Xt_train = pre.fit_transform(X_train, y_train)
+    Xt_val = pre.transform(X_val)
+    return Xt_train, Xt_val, time.perf_counter() - t0
+
+
+def _fit_candidate(cid, name, clf, params, Xt_train, y_train, Xt_val, y_val):
+    from sklearn.base import clone
+
+    _, metrics, _, _ = evaluate_model(name, clone(clf).set_params(**params), Xt_train, Xt_val, y_train, y_val)
+    metrics.update(candidate=cid, params=params, n_samples=Xt_train.shape[0], predict_rows=Xt_val.shape[0])
+    return metrics
+
+
+def successive_halving_search(
+    preprocessor,
+    X_train,
+    y_train,
+    X_val,
+    y_val,
+    n_candidates=8,
+    factor=3,
+    min_resources=None,
+    deadline=None,
+    n_jobs=-1,
+    random_state=42,
+):
+    from sklearn.model_selection import ParameterGrid, ParameterSampler
+
+    candidates = []
+    for name, (clf, grid) in search_space().items():
+        n_iter = min(n_candidates, len(ParameterGrid(grid)))
+        for params in ParameterSampler(grid, n_iter=n_iter, random_state=random_state):
+            candidates.append((len(candidates), name, clf, params))
+
+    # 초반 라운드는 작은 층화 표본에서 돌리고, 살아남은 후보만 factor배 큰 표본으로 승급
+    n_rounds = max(1, math.ceil(math.log(len(candidates), factor)))
+    resources = min_resources or max(len(y_train) // factor ** (n_rounds - 1), 200)
+
+    trials = []
+    alive = candidates
+    rnd = 0
+    with Parallel(n_jobs=n_jobs) as parallel:
+        while alive:
+            if rnd == n_rounds - 1:
+                resources = len(y_train)
+            idx = _stratified_subsample(y_train, resources, random_state + rnd)
+            y_sub = y_train.iloc[idx]
+            # 라운드 표본은 모든 후보가 같으므로 전처리는 한 번만, 후보별로는 분류기 fit만 분배
+            Xt_sub, Xt_val, preprocess_time = _transform_split(preprocessor, X_train.iloc[idx], y_sub, X_val)
+            results = parallel(
+                delayed(_fit_candidate)(cid, name, clf, params, Xt_sub, y_sub, Xt_val, y_val)
+                for cid, name, clf, params in alive
+            )
+            for m in results:
+                m.update(round=rnd, stage="halving", preprocess_time=preprocess_time)
+            trials.extend(results)
+            print(f"[search] round {rnd}: {len(alive)} candidates x {len(idx)} rows")
+
+            if len(idx) >= len(y_train) or len(alive) == 1:
+                break
+
+            keep = max(1, len(alive) // factor)
+            best = sorted(results, key=lambda m: m["roc_auc"], reverse=True)[:keep]
+            next_resources = len(y_train) if rnd + 1 == n_rounds - 1 else min(resources * factor, len(y_train))
+            if deadline is not None:
+                # 다음 라운드를 시작하기 전에, 살아남은 후보의 이번 라운드 시간을 표본 증가율만큼 키워 예산 안에 끝날지 추정
+                costs = _scaled_cost(pd.DataFrame(best), next_resources)
+                est = _estimate_seconds(costs, preprocess_time * next_resources / len(idx), n_jobs)
+                remaining = deadline - time.perf_counter()
+                if est > remaining:
+                    print(f"[search] next round needs ~{est:.1f}s but {max(remaining, 0):.1f}s of budget left, stopping early")
+                    break
+
+            survivors = {m["candidate"] for m in best}
+            alive = [c for c in alive if c[0] in survivors]
+            resources = next_resources
+            rnd += 1
+
+    return pd.DataFrame(trials)
+
+
+def _scaled_cost(trials: pd.DataFrame, n_rows):
+    # fit 시간은 학습 행 수에 비례한다고 보고, 예측은 같은 검증셋이라 그대로 둔다
+    return trials["fit_time"] * (n_rows / trials["n_samples"]) + trials["predict_time"]
+
+
+def _estimate_seconds(costs: pd.Series, preprocess_seconds, n_jobs):
+    # 후보들을 워커 수만큼 나눠 돌리되, 가장 긴 fit 하나보다 짧을 수는 없다
+    workers = max(1, min(effective_n_jobs(n_jobs), len(costs)))
+    return preprocess_seconds + max(costs.max(), costs.sum() / workers)
+
+
+def _pareto(trials: pd.DataFrame) -> pd.DataFrame:
+    # 행당 스코어링 비용이 낮은 순으로 보면서 ROC-AUC가 갱신되는 후보만 남긴다
+    t = trials.assign(predict_us_per_row=trials["predict_time"] / trials["predict_rows"] * 1e6)
+    t = t.sort_values(["predict_us_per_row", "roc_auc"], ascending=[True, False])
+    return t[t["roc_auc"] > t["roc_auc"].cummax().shift(fill_value=-np.inf)]
+
+
+def frontier_pool(trials: pd.DataFrame) -> set:
+    # 마지막 라운드 기준 잠정 프런티어 + 모델 계열별 최고 후보: 작은 표본에서 탈락한 저비용 모델도 전체 학습셋으로 다시 비교
+    last = trials.sort_values("round", kind="mergesort").groupby("candidate").tail(1)
+    best_per_model = last.sort_values(["round", "roc_auc"], kind="mergesort").groupby("model").tail(1)
+    return set(_pareto(last)["candidate"]) | set(best_per_model["candidate"])
+
+
+def refit_full(trials, candidate_ids, preprocessor, X_train, y_train, X_val, y_val, n_jobs=-1, deadline=None):
+    # 전체 학습셋에서 아직 평가되지 않은 후보만 다시 학습 (전처리는 한 번)
+    full = set(trials.loc[trials["n_samples"] == len(y_train), "candidate"])
+    last = trials.sort_values("round", kind="mergesort").groupby("candidate").tail(1)
+    todo = last[last["candidate"].isin(set(candidate_ids) - full)]
+    if todo.empty:
+        return trials.iloc[:0]
+
+    if deadline is not None:
+        # 같은 예산 안에서: 예상 비용이 작은 후보부터 남은 시간에 들어가는 만큼만 재학습
+        todo = todo.assign(est=_scaled_cost(todo, len(y_train))).sort_values("est", kind="mergesort")
+        preprocess_est = (todo["preprocess_time"] * len(y_train) / todo["n_samples"]).max()
+        remaining = deadline - time.perf_counter()
+        n_fit = 0
+        while n_fit < len(todo) and _estimate_seconds(todo["est"].iloc[: n_fit + 1], preprocess_est, n_jobs) <= remaining:
+            n_fit += 1
+        for r in todo.iloc[n_fit:].itertuples():
+            print(f"[search] budget: skip refit of {r.model} {r.params} (~{r.est:.1f}s)")
+        todo = todo.iloc[:n_fit]
+        if todo.empty:
+            return trials.iloc[:0]
+
+    space = search_space()
+    Xt_train, Xt_val, preprocess_time = _transform_split(preprocessor, X_train, y_train, X_val)
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_candidate)(r.candidate, r.model, space[r.model][0], r.params, Xt_train, y_train, Xt_val, y_val)
+        for r in todo.itertuples()
+    )
+    for m in results:
+        m.update(round=trials["round"].max() + 1, stage="refit", preprocess_time=preprocess_time)
+    print(f"[search] refit {len(results)} frontier candidates on {len(y_train)} rows")
+    return pd.DataFrame(results)
+
+
+def time_quality_frontier(trials: pd.DataFrame) -> pd.DataFrame:
+    # 같은 표본(전체 학습셋)에서 학습한 평가끼리만 스코어링 비용 대비 ROC-AUC 파레토 프런티어를 만든다
+    full = trials[trials["n_samples"] == trials["n_samples"].max()].drop_duplicates("candidate", keep="last")
+    cols = ["model", "params", "n_samples", "roc_auc", "f1", "fit_time", "predict_us_per_row"]
+    return _pareto(full)[cols].reset_index(drop=True)
+
+
+def run_search(X, y, preprocessor, out_dir, n_jobs=-1, budget=None, n_candidates=8):
+    from sklearn.model_selection import train_test_split
+
+    X_train, X_val, y_train, y_val = train_test_split(
         X, y, test_size=0.3, random_state=42, stratify=y
     )
+    t0 = time.perf_counter()
+    # 탐색 라운드와 프런티어 재학습이 같은 예산을 나눠 쓴다
+    deadline = t0 + budget if budget else None
+    trials = successive_halving_search(
+        preprocessor,
+        X_train,
+        y_train,
+        X_val,
+        y_val,
+        n_candidates=n_candidates,
+        deadline=deadline,
+        n_jobs=n_jobs,
+    )
+    refit = refit_full(
+        trials, frontier_pool(trials), preprocessor, X_train, y_train, X_val, y_val, n_jobs=n_jobs, deadline=deadline
+    )
+    trials = pd.concat([trials, refit], ignore_index=True)
+    elapsed = time.perf_counter() - t0
 
-    models = {
+    frontier = time_quality_frontier(trials)
+    trials.assign(params=trials["params"].astype(str)).to_csv(out_dir / "search_trials.csv", index=False)
+    frontier.assign(params=frontier["params"].astype(str)).to_csv(out_dir / "search_frontier.csv", index=False)
+
+    print(f"=== Successive Halving Search ({len(trials)} fits, {elapsed:.1f}s) ===")
+    print(f"Time/quality frontier (cheapest first, all fitted on {frontier['n_samples'].max()} rows):")
+    print(frontier.to_string(index=False))
+    print(f"Outputs saved to: {out_dir}")
+    return frontier
+
+
+def default_models():
+    # 모델 모듈(특히 sklearn.ensemble)은 학습 경로에서만 import
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.tree import DecisionTreeClassifier
+
+    return {
         "LogisticRegression": LogisticRegression(max_iter=2000, class_weight="balanced"),
         "DecisionTree": DecisionTreeClassifier(max_depth=8, min_samples_leaf=20, random_state=42),
         "RandomForest": RandomForestClassifier(
@@ -118,81 +439,175 @@ def main(data_path: str):
         ),
     }
 
+
+def _matrix_nbytes(M):
+    if hasattr(M, "indptr"):
+        return M.data.nbytes + M.indices.nbytes + M.indptr.nbytes
+    return np.asarray(M).nbytes
+
+
+def benchmark_encodings(df, target_col, out_dir, encoding=None, model_name="RandomForest"):
+    from sklearn.base import clone
+    from sklearn.model_selection import train_test_split
+
+    from encoders import ENCODING_STRATEGIES
+
+    y = df[target_col].astype(int)
+    configs = {s: {"default": s, "params": (encoding or {}).get("params")} for s in ENCODING_STRATEGIES}
+    if encoding:
+        configs["config"] = encoding
+
+    rows = []
+    for label, cfg in configs.items():
+        X, preprocessor = build_preprocessor(df, target_col, encoding=cfg)
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.3, random_state=42, stratify=y
+        )
+
+        t0 = time.perf_counter()
+        Xt = clone(preprocessor).fit_transform(X_train, y_train)
+        encode_time = time.perf_counter() - t0
+
+        pipe = make_pipeline(preprocessor, default_models()[model_name])
+        _, m, _, _ = evaluate_model(label, pipe, X_train, X_test, y_train, y_test)
+        rows.append(
+            {
+                "encoding": label,
+                "n_features": Xt.shape[1],
+                "matrix_mb": _matrix_nbytes(Xt) / 1e6,
+                "encode_time": encode_time,
+                "fit_time": m["fit_time"],
+                "predict_time": m["predict_time"],
+                "roc_auc": m["roc_auc"],
+                "f1": m["f1"],
+            }
+        )
+        print(f"[encoding] {label}: {Xt.shape[1]} cols, fit {m['fit_time']:.1f}s")
+
+    bench = pd.DataFrame(rows)
+    bench.to_csv(out_dir / "encoding_benchmark.csv", index=False)
+    print(f"=== Encoding Benchmark ({model_name}) ===")
+    print(bench.to_string(index=False))
+    return bench
+
+
+def main(data_path: str, cv_folds: int = 5, n_jobs: int = -1, cache_dir: str = None,
+         search: bool = False, budget: float = None, search_candidates: int = 8,
+         encoding_config: str = None, benchmark_encoding: bool = False,
+         plots: str = "background", out_dir: str = None):
+    from sklearn.model_selection import train_test_split
+
+    from encoders import load_encoding_config
+
+    data_file = Path(data_path)
+    if not data_file.exists():
+        raise FileNotFoundError(f"Data file not found: {data_file}")
+
+    out_dir = Path(out_dir) if out_dir else Path(__file__).resolve().parent / "outputs"
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    df = load_data(data_file)
+
+    target_col = "Risk_Flag"
+    if target_col not in df.columns:
+        raise ValueError("`Risk_Flag` column is required in dataset")
+
+    encoding = load_encoding_config(encoding_config)
+    if benchmark_encoding:
+        benchmark_encodings(df, target_col, out_dir, encoding=encoding)
+        return
+
+    y = df[target_col].astype(int)
+    X, preprocessor = build_preprocessor(df, target_col, encoding=encoding)
+
+    cache_path = Path(cache_dir) if cache_dir else out_dir / ".cache"
+    memory = Memory(location=str(cache_path), verbose=0)
+
+    if search:
+        run_search(X, y, preprocessor, out_dir, n_jobs=n_jobs, budget=budget, n_candidates=search_candidates)
+        return
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.3, random_state=42, stratify=y
+    )
+
+    models = default_models()
+
+    cv_summary = None
+    if cv_folds and cv_folds > 1:
+        cv_df = cross_validate_models(models, preprocessor, X, y, n_splits=cv_folds, n_jobs=n_jobs)
+        cv_df.to_csv(out_dir / "cv_folds.csv", index=False)
+        cv_summary = summarize_cv(cv_df)
+        cv_summary.to_csv(out_dir / "cv_metrics.csv", index=False)
+
     results = []
     fitted_models = {}
+    preds = {}
     probs = {}
 
     for name, clf in models.items():
-        pipe = Pipeline(steps=[("preprocess", preprocessor), ("model", clf)])
+        pipe = make_pipeline(preprocessor, clf, memory)
         fitted, m, pred, prob = evaluate_model(name, pipe, X_train, X_test, y_train, y_test)
         results.append(m)
         fitted_models[name] = fitted
+        preds[name] = pred
         probs[name] = prob
 
     metrics_df = pd.DataFrame(results).sort_values("roc_auc", ascending=False)
     metrics_df.to_csv(out_dir / "metrics.csv", index=False)
 
-    # Model comparison chart
-    fig, ax = plt.subplots(figsize=(8, 4))
-    plot_df = metrics_df.set_index("model")[["accuracy", "f1", "roc_auc"]]
-    plot_df.plot(kind="bar", ax=ax)
-    ax.set_title("Model Comparison")
-    ax.set_ylim(0, 1)
-    ax.legend(loc="lower right")
-    plt.tight_layout()
-    plt.savefig(out_dir / "model_comparison.png", dpi=150)
-    plt.close()
-
     # Focus on RandomForest (usually strongest baseline)
     best_name = metrics_df.iloc[0]["model"]
     best_model = fitted_models[best_name]
-    best_pred = best_model.predict(X_test)
+    best_pred = preds[best_name]
     best_prob = probs[best_name]
 
-    cm = confusion_matrix(y_test, best_pred)
-    plt.figure(figsize=(4.5, 4))
-    sns.heatmap(cm, annot=True, fmt="d", cmap="Blues")
-    plt.title(f"Confusion Matrix - {best_name}")
-    plt.xlabel("Predicted")
-    plt.ylabel("Actual")
-    plt.tight_layout()
-    plt.savefig(out_dir / "confusion_matrix_rf.png", dpi=150)
-    plt.close()
-
-    if best_prob is not None:
-        RocCurveDisplay.from_predictions(y_test, best_prob)
-        plt.title(f"ROC Curve - {best_name}")
-        plt.tight_layout()
-        plt.savefig(out_dir / "roc_curve_rf.png", dpi=150)
-        plt.close()
-
-    # Feature importance (if tree-based)
-    if best_name in ["RandomForest", "DecisionTree"]:
-        model_obj = best_model.named_steps["model"]
-        pre = best_model.named_steps["preprocess"]
-        feature_names = pre.get_feature_names_out()
-        importances = model_obj.feature_importances_
-
-        fi = (
-            pd.DataFrame({"feature": feature_names, "importance": importances})
-            .sort_values("importance", ascending=False)
-            .head(20)
-        )
+    model_path = export_model(best_model, best_name, X.columns, metrics_df.iloc[0].to_dict(), out_dir / "models")
 
-        plt.figure(figsize=(8, 6))
-        sns.barplot(data=fi, x="importance", y="feature")
-        plt.title(f"Top 20 Feature Importance - {best_name}")
-        plt.tight_layout()
-        plt.savefig(out_dir / "feature_importance_rf.png", dpi=150)
-        plt.close()
+    # 리포트 입력을 캐시한 뒤 플롯은 별도 단계(report.py)에서 렌더링
+    save_report_inputs(out_dir, best_name, y_test, best_pred, best_prob, feature_importances(best_model))
+    if plots == "background":
+        launch_background(out_dir)
+    elif plots == "foreground":
+        render_report(out_dir)
 
     print("=== Portfolio Summary ===")
     print(metrics_df.to_string(index=False))
+    if cv_summary is not None:
+        print(f"\n=== {cv_folds}-Fold Stratified CV (mean±std) ===")
+        print(format_cv_summary(cv_summary).to_string(index=False))
+    print(f"Model exported: {model_path}")
     print(f"Outputs saved to: {out_dir}")
+    if plots == "background":
+        print(f"Plots are rendering in the background (log: {out_dir / 'report.log'}; python report.py to regenerate)")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--data", required=True, help="Path to Training Data.csv")
+    parser.add_argument("--cv-folds", type=int, default=5, help="Stratified k-fold splits (0 to skip CV)")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="Parallel worker processes for CV")
+    parser.add_argument("--cache-dir", default=None, help="joblib cache for fitted preprocessors")
+    parser.add_argument("--search", action="store_true", help="Run successive halving hyperparameter search")
+    parser.add_argument("--budget", type=float, default=None, help="Search wall-clock budget in seconds")
+    parser.add_argument("--search-candidates", type=int, default=8, help="Sampled candidates per model family")
+    parser.add_argument("--encoding-config", default=None, help="JSON file with per-column categorical encoding")
+    parser.add_argument("--benchmark-encoding", action="store_true", help="Compare encoding strategies and exit")
+    parser.add_argument("--out-dir", default=None, help="Output directory (default: ./outputs next to this script)")
+    parser.add_argument("--no-plots", action="store_true", help="Skip PNG rendering (inputs are still cached)")
+    parser.add_argument("--plots-foreground", action="store_true", help="Render PNGs before exiting")
     args = parser.parse_args()
-    main(args.data)
+    plots = "none" if args.no_plots else ("foreground" if args.plots_foreground else "background")
+    main(
+        args.data,
+        cv_folds=args.cv_folds,
+        n_jobs=args.n_jobs,
+        cache_dir=args.cache_dir,
+        search=args.search,
+        budget=args.budget,
+        search_candidates=args.search_candidates,
+        encoding_config=args.encoding_config,
+        benchmark_encoding=args.benchmark_encoding,
+        plots=plots,
+        out_dir=args.out_dir,
+    )
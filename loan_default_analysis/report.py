@@ -0,0 +1,151 @@
+import argparse
+import json
+import subprocess
+import sys
+import traceback
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_OUT_DIR = Path(__file__).resolve().parent / "outputs"
+INPUTS_DIRNAME = "report_inputs"
+LOG_NAME = "report.log"
+DONE_MARKER = "report.done"
+FAILED_MARKER = "report.failed"
+
+
+def feature_importances(pipe) -> pd.DataFrame:
+    model_obj = pipe.named_steps["model"]
+    if hasattr(model_obj, "feature_importances_"):
+        importances = model_obj.feature_importances_
+        kind = "impurity"
+    elif hasattr(model_obj, "coef_"):
+        importances = np.abs(model_obj.coef_).ravel()
+        kind = "abs_coef"
+    else:
+        return pd.DataFrame(columns=["feature", "importance", "kind"])
+
+    feature_names = pipe.named_steps["preprocess"].get_feature_names_out()
+    return (
+        pd.DataFrame({"feature": feature_names, "importance": importances, "kind": kind})
+        .sort_values("importance", ascending=False)
+        .reset_index(drop=True)
+    )
+
+
+def save_report_inputs(out_dir: Path, best_name, y_true, pred, prob, importances: pd.DataFrame) -> Path:
+    # 플롯에 필요한 입력만 디스크에 남겨 재학습 없이 리포트를 다시 그릴 수 있게 한다
+    inputs_dir = Path(out_dir) / INPUTS_DIRNAME
+    inputs_dir.mkdir(parents=True, exist_ok=True)
+    # 입력이 바뀌었으므로 이전 렌더링 결과 표시는 무효
+    clear_status(out_dir)
+
+    preds = pd.DataFrame({"y_true": np.asarray(y_true), "pred": np.asarray(pred)})
+    if prob is not None:
+        preds["prob"] = np.asarray(prob)
+    preds.to_csv(inputs_dir / "predictions.csv", index=False)
+    importances.to_csv(inputs_dir / "importances.csv", index=False)
+    with open(inputs_dir / "meta.json", "w", encoding="utf-8") as f:
+        json.dump({"best_model": best_name}, f, ensure_ascii=False, indent=2)
+    return inputs_dir
+
+
+def render_report(out_dir: Path = DEFAULT_OUT_DIR, dpi=150, top_n=20):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from sklearn.metrics import RocCurveDisplay, confusion_matrix
+
+    sns.set_theme(style="darkgrid")
+    out_dir = Path(out_dir)
+    inputs_dir = out_dir / INPUTS_DIRNAME
+
+    metrics_df = pd.read_csv(out_dir / "metrics.csv")
+    preds = pd.read_csv(inputs_dir / "predictions.csv")
+    fi = pd.read_csv(inputs_dir / "importances.csv")
+    with open(inputs_dir / "meta.json", "r", encoding="utf-8") as f:
+        best_name = json.load(f)["best_model"]
+
+    # Model comparison chart
+    fig, ax = plt.subplots(figsize=(8, 4))
+    plot_df = metrics_df.set_index("model")[["accuracy", "f1", "roc_auc"]]
+    plot_df.plot(kind="bar", ax=ax)
+    ax.set_title("Model Comparison")
+    ax.set_ylim(0, 1)
+    ax.legend(loc="lower right")
+    plt.tight_layout()
+    plt.savefig(out_dir / "model_comparison.png", dpi=dpi)
+    plt.close()
+
+    cm = confusion_matrix(preds["y_true"], preds["pred"])
+    plt.figure(figsize=(4.5, 4))
+    sns.heatmap(cm, annot=True, fmt="d", cmap="Blues")
+    plt.title(f"Confusion Matrix - {best_name}")
+    plt.xlabel("Predicted")
+    plt.ylabel("Actual")
+    plt.tight_layout()
+    plt.savefig(out_dir / "confusion_matrix_rf.png", dpi=dpi)
+    plt.close()
+
+    if "prob" in preds.columns:
+        RocCurveDisplay.from_predictions(preds["y_true"], preds["prob"])
+        plt.title(f"ROC Curve - {best_name}")
+        plt.tight_layout()
+        plt.savefig(out_dir / "roc_curve_rf.png", dpi=dpi)
+        plt.close()
+
+    if not fi.empty:
+        plt.figure(figsize=(8, 6))
+        sns.barplot(data=fi.head(top_n), x="importance", y="feature")
+        plt.title(f"Top {top_n} Feature Importance ({fi['kind'].iloc[0]}) - {best_name}")
+        plt.tight_layout()
+        plt.savefig(out_dir / "feature_importance_rf.png", dpi=dpi)
+        plt.close()
+
+    print(f"Report rendered: {out_dir}")
+
+
+def clear_status(out_dir: Path):
+    for name in (DONE_MARKER, FAILED_MARKER):
+        (Path(out_dir) / name).unlink(missing_ok=True)
+
+
+def run_report(out_dir: Path = DEFAULT_OUT_DIR, dpi=150):
+    # 완료/실패 표시 파일을 남겨 백그라운드 렌더링 결과를 나중에 확인할 수 있게 한다
+    out_dir = Path(out_dir)
+    clear_status(out_dir)
+    ts = datetime.now().isoformat(timespec="seconds")
+    try:
+        render_report(out_dir, dpi=dpi)
+    except Exception as e:
+        (out_dir / FAILED_MARKER).write_text(f"{ts} {type(e).__name__}: {e}\n", encoding="utf-8")
+        traceback.print_exc()
+        return 1
+    (out_dir / DONE_MARKER).write_text(f"{ts}\n", encoding="utf-8")
+    return 0
+
+
+def launch_background(out_dir: Path):
+    # 지표 저장 이후 별도 프로세스에서 렌더링 (학습 프로세스는 기다리지 않음)
+    # 출력/트레이스백은 report.log에, 결과는 report.done / report.failed 로 남긴다
+    out_dir = Path(out_dir)
+    clear_status(out_dir)
+    with open(out_dir / LOG_NAME, "w", encoding="utf-8") as log:
+        return subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--out-dir", str(out_dir)],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out-dir", default=str(DEFAULT_OUT_DIR), help="Directory with metrics.csv and report_inputs/")
+    parser.add_argument("--dpi", type=int, default=150)
+    args = parser.parse_args()
+    sys.exit(run_report(Path(args.out_dir), dpi=args.dpi))
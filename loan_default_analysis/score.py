@@ -0,0 +1,125 @@
+import argparse
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import joblib
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+
+DEFAULT_MODEL_DIR = Path(__file__).resolve().parent / "outputs" / "models"
+ID_COL = "Id"
+TARGET_COL = "Risk_Flag"
+
+
+def resolve_model_path(model_path=None) -> Path:
+    if model_path:
+        return Path(model_path)
+    latest = DEFAULT_MODEL_DIR / "LATEST"
+    if not latest.exists():
+        raise FileNotFoundError(f"No exported model found in {DEFAULT_MODEL_DIR}; run loan_default_analysis.py first")
+    return DEFAULT_MODEL_DIR / latest.read_text(encoding="utf-8").strip()
+
+
+@lru_cache(maxsize=4)
+def load_model(model_path: str):
+    # 워커 프로세스마다 한 번만 로드 (청크마다 모델을 다시 직렬화하지 않음)
+    bundle = joblib.load(model_path)
+    model = bundle["pipeline"].named_steps["model"]
+    if "n_jobs" in model.get_params():
+        # 병렬성은 청크 단위로 확보하므로 모델 내부 스레드는 1개로 제한
+        model.set_params(n_jobs=1)
+    return bundle
+
+
+def iter_chunks(path: Path, chunksize: int):
+    if path.suffix.lower() == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Parquet 입력에는 pyarrow가 필요합니다.") from e
+        pf = pq.ParquetFile(path)
+        for batch in pf.iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, encoding="ISO-8859-1", chunksize=chunksize)
+
+
+def score_chunk(model_path: str, chunk: pd.DataFrame) -> pd.DataFrame:
+    bundle = load_model(model_path)
+    pipe = bundle["pipeline"]
+    prob = pipe.predict_proba(chunk[bundle["features"]])[:, 1]
+
+    out = pd.DataFrame({TARGET_COL: prob}, index=chunk.index)
+    if ID_COL in chunk.columns:
+        out.insert(0, ID_COL, chunk[ID_COL].to_numpy())
+    return out
+
+
+class _ChunkWriter:
+    def __init__(self, path: Path):
+        self.path = path
+        self.parquet = path.suffix.lower() == ".parquet"
+        self._writer = None
+        self._first = True
+
+    def write(self, df: pd.DataFrame):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            df.to_csv(self.path, mode="w" if self._first else "a", header=self._first, index=False)
+        self._first = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def score_file(input_path, output_path, model_path=None, chunksize=100_000, n_jobs=-1):
+    input_path, output_path = Path(input_path), Path(output_path)
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input file not found: {input_path}")
+    model_file = str(resolve_model_path(model_path))
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    n_workers = effective_n_jobs(n_jobs)
+    writer = _ChunkWriter(output_path)
+    n_rows = 0
+    t0 = time.perf_counter()
+    try:
+        # generator 반환 + pre_dispatch로 동시에 메모리에 올라오는 청크 수를 제한
+        results = Parallel(n_jobs=n_jobs, return_as="generator", pre_dispatch=2 * n_workers)(
+            delayed(score_chunk)(model_file, chunk) for chunk in iter_chunks(input_path, chunksize)
+        )
+        for scored in results:
+            writer.write(scored)
+            n_rows += len(scored)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - t0
+
+    rate = n_rows / elapsed if elapsed > 0 else float("nan")
+    print(f"Scored {n_rows:,} rows in {elapsed:.1f}s ({rate:,.0f} rows/sec) with {Path(model_file).name}")
+    print(f"Saved: {output_path}")
+    return {"rows": n_rows, "seconds": elapsed, "rows_per_sec": rate}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", required=True, help="Applicant CSV or Parquet file")
+    parser.add_argument("--output", required=True, help="Output CSV or Parquet with Risk_Flag probabilities")
+    parser.add_argument("--model", default=None, help="Exported model (.joblib); defaults to outputs/models/LATEST")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="Rows per scoring chunk")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="Parallel scoring processes")
+    args = parser.parse_args()
+
+    # 워커 프로세스가 score_chunk/load_model을 __main__이 아닌 score 모듈에서 찾도록 모듈로 다시 임포트
+    import score
+
+    score.score_file(args.input, args.output, model_path=args.model, chunksize=args.chunksize, n_jobs=args.n_jobs)
@@ -0,0 +1,202 @@
+import os
+import argparse
+from glob import glob
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from news_alpha import LONG_THRESHOLD, SHORT_THRESHOLD
+
+DEFAULT_HORIZONS = (1, 5, 20)
+
+# news_alpha는 UTC ISO로 저장하지만 이전 CSV는 RSS 원문(RFC 822) 시각일 수 있다
+RFC822_FORMAT = '%a, %d %b %Y %H:%M:%S %z'
+RFC822_UTC_RE = r' (?:GMT|UTC|UT|Z)$'
+
+
+def load_table(paths, columns=None):
+    frames = []
+    for pattern in paths:
+        for path in sorted(glob(pattern)) or [pattern]:
+            if path.endswith('.parquet'):
+                frames.append(pd.read_parquet(path, columns=columns))
+            else:
+                frames.append(pd.read_csv(path, usecols=columns))
+    return pd.concat(frames, ignore_index=True)
+
+
+def to_utc(s: pd.Series) -> pd.Series:
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s.dt.tz_localize('UTC') if s.dt.tz is None else s.dt.tz_convert('UTC')
+    # 고정 포맷부터 벡터화 파싱하고, 어디에도 맞지 않는 값만 요소별('mixed')로 파싱
+    out = pd.to_datetime(s, utc=True, errors='coerce', format='ISO8601')
+    todo = out.isna() & s.notna()
+    if todo.any():
+        # %Z(GMT)는 느린 경로를 타므로 +0000으로 바꿔 %z 한 포맷으로 처리
+        rfc = s[todo].astype(str).str.replace(RFC822_UTC_RE, ' +0000', regex=True)
+        out[todo] = pd.to_datetime(rfc, utc=True, errors='coerce', format=RFC822_FORMAT)
+        todo = out.isna() & s.notna()
+    if todo.any():
+        out[todo] = pd.to_datetime(s[todo], utc=True, errors='coerce', format='mixed')
+    return out
+
+
+def prepare_events(events: pd.DataFrame) -> pd.DataFrame:
+    # 실행마다 같은 라이브 피드를 다시 읽으므로 article_scores_*.csv를 합치면 같은 기사가 여러 번 들어온다
+    # -> scorer x ticker x 기사(링크, 없으면 제목+게시 시각) 단위로 한 번만 남긴다
+    ev = events.copy()
+    ev['published'] = to_utc(ev['published'])
+    ev = ev.dropna(subset=['published', 'score'])
+    if 'scorer' not in ev.columns:
+        ev['scorer'] = 'unknown'
+    link = ev['link'].fillna('').astype(str) if 'link' in ev.columns else pd.Series('', index=ev.index)
+    title = ev['title'].fillna('').astype(str) if 'title' in ev.columns else pd.Series('', index=ev.index)
+    no_link = link == ''
+    # 링크가 있으면 게시 시각은 키에서 빼서(NaT) 피드마다 시각 표기가 달라도 같은 기사로 본다
+    key = pd.DataFrame({'article': link.where(~no_link, title), 'at': ev['published'].where(no_link)})
+    keep = ~pd.concat([ev[['scorer', 'ticker']], key], axis=1).duplicated()
+    return ev[keep]
+
+
+def prepare_prices(prices: pd.DataFrame, horizons=DEFAULT_HORIZONS) -> pd.DataFrame:
+    # 입력: ticker, ts(바 시각, UTC) 또는 date, close
+    px = prices.copy()
+    if 'ts' not in px.columns:
+        px['ts'] = px['date']
+    px['ts'] = to_utc(px['ts'])
+    px = px.dropna(subset=['ts', 'close']).sort_values(['ticker', 'ts'], kind='mergesort')
+
+    # 종목별 h바 이후 종가 대비 수익률을 한 번에 계산 (groupby shift, 루프 없음)
+    g = px.groupby('ticker', sort=False)['close']
+    for h in horizons:
+        px[f'fwd_ret_{h}'] = g.shift(-h) / px['close'] - 1.0
+    return px[['ticker', 'ts', 'close', *[f'fwd_ret_{h}' for h in horizons]]]
+
+
+def align_events(events: pd.DataFrame, px: pd.DataFrame) -> pd.DataFrame:
+    # 기사 게시 시각 "이후" 첫 바에 진입 (같은 시각 바는 제외해 look-ahead 방지)
+    ev = events.copy()
+    ev['published'] = to_utc(ev['published'])
+    ev = ev.dropna(subset=['published', 'score'])
+    if 'scorer' not in ev.columns:
+        ev['scorer'] = 'unknown'
+    ev = ev.sort_values('published', kind='mergesort')
+
+    tickers = ev['ticker'].astype(str)
+    px = px[px['ticker'].isin(tickers.unique())]
+    merged = pd.merge_asof(
+        ev.assign(ticker=tickers),
+        px.rename(columns={'ts': 'entry_ts', 'close': 'entry_close'}).sort_values('entry_ts', kind='mergesort'),
+        left_on='published',
+        right_on='entry_ts',
+        by='ticker',
+        direction='forward',
+        allow_exact_matches=False,
+    )
+    return merged.dropna(subset=['entry_ts'])
+
+
+def daily_signals(events: pd.DataFrame) -> pd.DataFrame:
+    # news_alpha.main과 같은 규칙: 종목별 점수 합계 >= LONG / <= SHORT
+    ev = events.copy()
+    ev['published'] = to_utc(ev['published'])
+    ev['day'] = ev['published'].dt.floor('D')
+    if 'scorer' not in ev.columns:
+        ev['scorer'] = 'unknown'
+    agg = ev.groupby(['scorer', 'ticker', 'day'], as_index=False)['score'].sum()
+    agg['signal'] = np.select(
+        [agg['score'] >= LONG_THRESHOLD, agg['score'] <= SHORT_THRESHOLD], ['LONG', 'SHORT'], 'NEUTRAL'
+    )
+    # 하루치 집계는 그날이 끝난 뒤에야 알 수 있으므로 당일 마지막 시각을 기준으로 정렬
+    agg['published'] = agg['day'] + pd.Timedelta(days=1) - pd.Timedelta(microseconds=1)
+    return agg.drop(columns='day')
+
+
+def _grouped_stats(df: pd.DataFrame, keys, horizons) -> pd.DataFrame:
+    # 그룹별 hit rate와 IC(Spearman)를 합계 통계량으로 계산 -> 그룹 수와 무관하게 벡터화
+    out = []
+    for h in horizons:
+        col = f'fwd_ret_{h}'
+        d = df.loc[df[col].notna(), [*keys, 'score', col]]
+        if d.empty:
+            continue
+        sign_s = np.sign(d['score'].to_numpy())
+        sign_r = np.sign(d[col].to_numpy())
+        d = d.assign(
+            directional=sign_s != 0,
+            hit=(sign_s != 0) & (sign_s == sign_r),
+            x=d.groupby(keys, sort=False)['score'].rank(),
+            y=d.groupby(keys, sort=False)[col].rank(),
+        )
+        d = d.assign(xx=d['x'] ** 2, yy=d['y'] ** 2, xy=d['x'] * d['y'])
+        g = d.groupby(keys, sort=True)
+        s = g[['x', 'y', 'xx', 'yy', 'xy', 'hit', 'directional']].sum()
+        n = g.size()
+        cov = s['xy'] - s['x'] * s['y'] / n
+        var_x = s['xx'] - s['x'] ** 2 / n
+        var_y = s['yy'] - s['y'] ** 2 / n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ic = cov / np.sqrt(var_x * var_y)
+            hit_rate = s['hit'] / s['directional']
+        res = pd.DataFrame(
+            {
+                'horizon': h,
+                'n': n,
+                'n_directional': s['directional'].astype(int),
+                'hit_rate': hit_rate,
+                'ic': ic.replace([np.inf, -np.inf], np.nan),
+                'mean_ret': g[col].mean(),
+            }
+        ).reset_index()
+        out.append(res)
+    return pd.concat(out, ignore_index=True) if out else pd.DataFrame()
+
+
+def run_event_study(events: pd.DataFrame, prices: pd.DataFrame, horizons=DEFAULT_HORIZONS):
+    px = prepare_prices(prices, horizons)
+    events = prepare_events(events)
+
+    aligned = align_events(events, px)
+    by_ticker = _grouped_stats(aligned, ['scorer', 'ticker'], horizons)
+    by_scorer = _grouped_stats(aligned, ['scorer'], horizons)
+
+    signals = align_events(daily_signals(events), px)
+    by_signal = _grouped_stats(signals, ['scorer', 'signal'], horizons)
+
+    return {
+        'by_scorer': by_scorer,
+        'by_ticker': by_ticker,
+        'by_signal': by_signal,
+        'n_events': len(aligned),
+        'n_unique': len(events),
+    }
+
+
+def main(score_paths, price_paths, horizons=DEFAULT_HORIZONS, out_dir='outputs'):
+    events = load_table(score_paths)
+    prices = load_table(price_paths)
+    result = run_event_study(events, prices, horizons)
+
+    os.makedirs(out_dir, exist_ok=True)
+    ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+    for name in ('by_scorer', 'by_ticker', 'by_signal'):
+        result[name].to_csv(os.path.join(out_dir, f'event_study_{name}_{ts}.csv'), index=False)
+
+    print(f"Aligned events: {result['n_events']:,} / {result['n_unique']:,} unique ({len(events):,} rows)")
+    print('\nBy scorer:')
+    print(result['by_scorer'].to_string(index=False))
+    print('\nBy signal (daily aggregated, LONG/SHORT thresholds):')
+    print(result['by_signal'].to_string(index=False))
+    print(f'\nSaved: {out_dir}/event_study_*_{ts}.csv')
+    return result
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--scores', nargs='+', required=True, help='article score CSV/Parquet (glob ok): ticker, published, score[, scorer]')
+    ap.add_argument('--prices', nargs='+', required=True, help='price bars CSV/Parquet (glob ok): ticker, ts|date, close')
+    ap.add_argument('--horizons', nargs='+', type=int, default=list(DEFAULT_HORIZONS), help='forward return horizons in bars')
+    ap.add_argument('--out-dir', default='outputs')
+    args = ap.parse_args()
+    main(args.scores, args.prices, horizons=args.horizons, out_dir=args.out_dir)
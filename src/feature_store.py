@@ -0,0 +1,92 @@
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import instrumentation as metrics
+
+# news_alpha(쓰기)와 kiwoom 봇(읽기)이 같은 파일을 보도록 모듈 옆에 둔다 (FEATURE_STORE_PATH로 변경 가능)
+DEFAULT_PATH = os.getenv(
+    'FEATURE_STORE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'feature_store.db'),
+)
+
+TS_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+def utc_ts(d=None):
+    d = d or datetime.now(timezone.utc)
+    if d.tzinfo is None:
+        d = d.replace(tzinfo=timezone.utc)
+    return d.astimezone(timezone.utc).strftime(TS_FORMAT)
+
+
+class FeatureStore:
+    def __init__(self, path=None):
+        path = path or DEFAULT_PATH
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        # (entity, feature, ts) 기본키 하나로 "최신값" 조회가 인덱스 역방향 탐색 1회로 끝난다
+        self.conn.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS features (
+                entity TEXT NOT NULL,
+                feature TEXT NOT NULL,
+                ts TEXT NOT NULL,
+                value REAL,
+                PRIMARY KEY (entity, feature, ts)
+            ) WITHOUT ROWID
+            '''
+        )
+        self.conn.commit()
+        self._cache = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        self.conn.close()
+
+    def put_many(self, rows):
+        # rows: (entity, feature, ts, value). 같은 시각의 피처는 한 번만 기록 (이미 있으면 무시)
+        rows = list(rows)
+        before = self.conn.total_changes
+        with self.conn:
+            self.conn.executemany('INSERT OR IGNORE INTO features(entity,feature,ts,value) VALUES(?,?,?,?)', rows)
+        for entity, feature, _, _ in rows:
+            self._cache.pop((entity, feature), None)
+        return self.conn.total_changes - before
+
+    def put(self, entity, feature, ts, value):
+        return self.put_many([(entity, feature, ts, value)])
+
+    def get(self, entity, feature, ts):
+        row = self.conn.execute(
+            'SELECT value FROM features WHERE entity=? AND feature=? AND ts=?', (entity, feature, ts)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def latest(self, entity, feature, max_age_hours=None):
+        key = (entity, feature)
+        if key in self._cache:
+            metrics.incr('feature_store_hits_total', feature=feature)
+            row = self._cache[key]
+        else:
+            row = self.conn.execute(
+                'SELECT value, ts FROM features WHERE entity=? AND feature=? ORDER BY ts DESC LIMIT 1',
+                (entity, feature),
+            ).fetchone()
+            self._cache[key] = row
+            metrics.incr('feature_store_lookups_total', feature=feature)
+        if row is None:
+            return None
+        if max_age_hours is not None:
+            cutoff = utc_ts(datetime.now(timezone.utc) - timedelta(hours=max_age_hours))
+            if row[1] < cutoff:
+                return None
+        return row
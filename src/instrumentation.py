@@ -0,0 +1,242 @@
+import os
+import json
+import time
+import threading
+import functools
+from datetime import datetime, timezone
+from pathlib import Path
+
+# 사용법
+#   ALPHA_METRICS=1                     계측 활성화 (기본 비활성: span/incr 호출은 플래그 확인 후 즉시 반환)
+#   ALPHA_METRICS_DIR=metrics           JSON 로그(events.jsonl), Prometheus textfile(<job>.prom) 저장 위치
+#   ALPHA_PROFILE=cprofile|pyinstrument 실행 단위 프로파일을 <dir>/profiles 에 저장
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class _State:
+    def __init__(self):
+        self.enabled = os.getenv("ALPHA_METRICS", "").lower() in ("1", "true", "yes")
+        self.out_dir = Path(os.getenv("ALPHA_METRICS_DIR", "metrics"))
+        self.profile = os.getenv("ALPHA_PROFILE", "").lower() or None
+        self.job = None
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+        self.log_file = None
+
+
+_STATE = _State()
+
+
+def configure(enabled=None, out_dir=None, profile=None):
+    if enabled is not None:
+        _STATE.enabled = bool(enabled)
+    if out_dir is not None:
+        _STATE.out_dir = Path(out_dir)
+    if profile is not None:
+        _STATE.profile = profile or None
+
+
+def enabled():
+    return _STATE.enabled
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def _emit(event):
+    if _STATE.log_file is None:
+        _STATE.out_dir.mkdir(parents=True, exist_ok=True)
+        _STATE.log_file = open(_STATE.out_dir / "events.jsonl", "a", encoding="utf-8")
+    event = {"ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"), "job": _STATE.job, **event}
+    with _STATE.lock:
+        _STATE.log_file.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+
+
+def incr(name, value=1, **labels):
+    if not _STATE.enabled:
+        return
+    k = _key(name, labels)
+    with _STATE.lock:
+        _STATE.counters[k] = _STATE.counters.get(k, 0) + value
+
+
+def observe(name, value, **labels):
+    if not _STATE.enabled:
+        return
+    k = _key(name, labels)
+    with _STATE.lock:
+        h = _STATE.histograms.get(k)
+        if h is None:
+            h = _STATE.histograms[k] = {"buckets": [0] * len(DEFAULT_BUCKETS), "sum": 0.0, "count": 0}
+        for i, b in enumerate(DEFAULT_BUCKETS):
+            if value <= b:
+                h["buckets"][i] += 1
+        h["sum"] += value
+        h["count"] += 1
+
+
+class _NoopSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+class _Span:
+    def __init__(self, name, labels):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.t0
+        status = "error" if exc_type else "ok"
+        observe("stage_duration_seconds", elapsed, stage=self.name, **self.labels)
+        if exc_type:
+            incr("stage_errors_total", stage=self.name)
+        _emit({"event": "span", "stage": self.name, "duration_s": round(elapsed, 6), "status": status, **self.labels})
+        return False
+
+
+def span(name, **labels):
+    # with span("fetch_news"): ...   (함수 전체는 @timed("fetch_news"))
+    if not _STATE.enabled:
+        return _NOOP
+    return _Span(name, labels)
+
+
+def timed(name=None, **labels):
+    def deco(fn):
+        stage = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _STATE.enabled:
+                return fn(*args, **kwargs)
+            with _Span(stage, labels):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return deco
+
+
+def _fmt_labels(labels):
+    if not labels:
+        return ""
+    inner = ",".join(f'{k}="{str(v)}"' for k, v in labels)
+    return "{" + inner + "}"
+
+
+def prometheus_text():
+    lines = []
+    with _STATE.lock:
+        seen = set()
+        for (name, labels), v in sorted(_STATE.counters.items()):
+            if name not in seen:
+                lines.append(f"# TYPE alpha_{name} counter")
+                seen.add(name)
+            lines.append(f"alpha_{name}{_fmt_labels(labels)} {v}")
+        for (name, labels), h in sorted(_STATE.histograms.items()):
+            if name not in seen:
+                lines.append(f"# TYPE alpha_{name} histogram")
+                seen.add(name)
+            for b, c in zip(DEFAULT_BUCKETS, h["buckets"]):
+                lines.append(f"alpha_{name}_bucket{_fmt_labels(labels + (('le', b),))} {c}")
+            lines.append(f"alpha_{name}_bucket{_fmt_labels(labels + (('le', '+Inf'),))} {h['count']}")
+            lines.append(f"alpha_{name}_sum{_fmt_labels(labels)} {h['sum']}")
+            lines.append(f"alpha_{name}_count{_fmt_labels(labels)} {h['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path):
+    # node_exporter textfile collector가 반쯤 쓰인 파일을 읽지 않도록 원자적으로 교체
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".prom.tmp")
+    tmp.write_text(prometheus_text(), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class _Profiler:
+    def __init__(self, kind):
+        self.kind = kind
+        self.impl = None
+
+    def start(self):
+        if self.kind == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                print("[metrics] pyinstrument 미설치, cProfile로 대체")
+                self.kind = "cprofile"
+            else:
+                self.impl = Profiler()
+                self.impl.start()
+                return
+        import cProfile
+
+        self.impl = cProfile.Profile()
+        self.impl.enable()
+
+    def stop(self, out_dir, job):
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        out_dir.mkdir(parents=True, exist_ok=True)
+        if self.kind == "pyinstrument":
+            self.impl.stop()
+            path = out_dir / f"{job}_{ts}.html"
+            path.write_text(self.impl.output_html(), encoding="utf-8")
+        else:
+            self.impl.disable()
+            path = out_dir / f"{job}_{ts}.prof"
+            self.impl.dump_stats(str(path))
+        return path
+
+
+class _Run:
+    def __init__(self, job):
+        self.job = job
+        self.profiler = None
+        self.span = None
+
+    def __enter__(self):
+        if not _STATE.enabled:
+            return self
+        _STATE.job = self.job
+        if _STATE.profile:
+            self.profiler = _Profiler(_STATE.profile)
+            self.profiler.start()
+        self.span = _Span("run", {})
+        self.span.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not _STATE.enabled:
+            return False
+        self.span.__exit__(exc_type, exc, tb)
+        with _STATE.lock:
+            counters = {f"{n}{_fmt_labels(l)}": v for (n, l), v in sorted(_STATE.counters.items())}
+        _emit({"event": "summary", "counters": counters})
+        if self.profiler:
+            path = self.profiler.stop(_STATE.out_dir / "profiles", self.job)
+            _emit({"event": "profile", "path": str(path)})
+        write_prometheus(_STATE.out_dir / f"{self.job}.prom")
+        if _STATE.log_file is not None:
+            _STATE.log_file.close()
+            _STATE.log_file = None
+        return False
+
+
+def run(job):
+    # 엔트리 포인트 1회 실행 단위: 전체 span + 종료 시 Prometheus textfile/프로파일 저장
+    return _Run(job)
@@ -1,10 +1,13 @@
 ﻿import os
 import re
 import argparse
-from datetime import datetime
-import feedparser
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import pandas as pd
 
+import instrumentation as metrics
+from feature_store import FeatureStore, utc_ts
+
 TICKER_MAP = {
     'AAPL': ['apple', 'iphone'],
     'MSFT': ['microsoft', 'azure'],
@@ -13,22 +16,51 @@ TICKER_MAP = {
     '005930.KS': ['samsung', 'galaxy', 'memory chip'],
 }
 
+# 종목별 점수 합계 기준 시그널 임계값 (event_study.py에서도 사용)
+LONG_THRESHOLD = 2
+SHORT_THRESHOLD = -2
+
+# 기사마다 패턴을 다시 해석하지 않도록 한 번만 컴파일 (news_backfill.py에서도 사용)
+HTML_TAG_RE = re.compile('<[^<]+?>')
+
+
+def to_utc_iso(value):
+    # RFC 822(RSS) / ISO 8601(Atom, JSON) -> 'YYYY-MM-DDTHH:MM:SSZ'. 시간대 없으면 UTC로 간주 (news_backfill.py에서도 사용)
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        d = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            d = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if d.tzinfo is None:
+        d = d.replace(tzinfo=timezone.utc)
+    return d.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
 RSS_FEEDS = [
     'https://feeds.reuters.com/reuters/businessNews',
     'https://feeds.reuters.com/news/wealth'
 ]
 
 
+@metrics.timed('fetch_news')
 def fetch_news(limit_per_feed=30):
+    import feedparser
+
     rows = []
     for url in RSS_FEEDS:
-        feed = feedparser.parse(url)
+        with metrics.span('fetch_feed'):
+            feed = feedparser.parse(url)
+        metrics.incr('external_calls_total', service='rss')
         for e in feed.entries[:limit_per_feed]:
             rows.append({
                 'title': e.get('title', ''),
-                'summary': re.sub('<[^<]+?>', '', e.get('summary', '')),
+                'summary': HTML_TAG_RE.sub('', e.get('summary', '')),
                 'link': e.get('link', ''),
-                'published': e.get('published', ''),
+                'published': to_utc_iso(e.get('published', '')),
             })
     return pd.DataFrame(rows)
 
@@ -50,32 +82,24 @@ def score_rule_based(text):
     return max(-3, min(3, s))
 
 
+@metrics.timed('score_with_llm')
 def score_with_llm(text, client, model):
     prompt = (
         'You are a finance signal classifier. Return only one integer from -3 to 3 '\
         'for short-term stock impact sentiment for this news:\n' + text[:1500]
     )
     r = client.responses.create(model=model, input=prompt)
+    metrics.incr('external_calls_total', service='openai')
     out = r.output_text.strip()
     try:
         return int(re.findall(r'-?\d+', out)[0])
     except Exception:
+        metrics.incr('llm_fallback_total')
         return score_rule_based(text)
 
 
-def main(use_llm=False):
-    df = fetch_news()
-    if df.empty:
-        print('No news fetched')
-        return
-
+def score_articles(df, use_llm, client, model):
     rows = []
-    client = None
-    model = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
-    if use_llm:
-        from openai import OpenAI
-        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'), base_url=os.getenv('OPENAI_BASE_URL') or None)
-
     for _, r in df.iterrows():
         text = f"{r['title']}\n{r['summary']}"
         tickers = map_tickers(text)
@@ -87,9 +111,27 @@ def main(use_llm=False):
                 'ticker': t,
                 'title': r['title'],
                 'score': sc,
+                'scorer': 'llm' if use_llm and client else 'rule',
                 'link': r['link'],
                 'published': r['published'],
             })
+    return rows
+
+
+def main(use_llm=False):
+    df = fetch_news()
+    if df.empty:
+        print('No news fetched')
+        return
+
+    client = None
+    model = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+    if use_llm:
+        from openai import OpenAI
+        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'), base_url=os.getenv('OPENAI_BASE_URL') or None)
+
+    with metrics.span('score_articles', scorer='llm' if use_llm else 'rule'):
+        rows = score_articles(df, use_llm, client, model)
 
     out = pd.DataFrame(rows)
     if out.empty:
@@ -97,12 +139,33 @@ def main(use_llm=False):
         return
 
     agg = out.groupby('ticker', as_index=False)['score'].sum().sort_values('score', ascending=False)
-    agg['signal'] = agg['score'].apply(lambda x: 'LONG' if x >= 2 else ('SHORT' if x <= -2 else 'NEUTRAL'))
+    agg['signal'] = agg['score'].apply(
+        lambda x: 'LONG' if x >= LONG_THRESHOLD else ('SHORT' if x <= SHORT_THRESHOLD else 'NEUTRAL')
+    )
 
-    os.makedirs('outputs', exist_ok=True)
-    ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-    out_file = f'outputs/alpha_candidates_{ts}.csv'
-    agg.to_csv(out_file, index=False)
+    with metrics.span('write_csv'):
+        os.makedirs('outputs', exist_ok=True)
+        ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+        out_file = f'outputs/alpha_candidates_{ts}.csv'
+        agg.to_csv(out_file, index=False)
+        # 기사 단위 점수는 이벤트 스터디(event_study.py) 입력으로 보존
+        out.to_csv(f'outputs/article_scores_{ts}.csv', index=False)
+
+    # 종목별 뉴스 점수를 피처 스토어에 기록 (kiwoom 봇이 CSV 없이 조회)
+    # news_mean: 기사 평균 점수를 기사 1건 범위(-3~3)로 제한 -> 봇은 이 값 하나만 조회
+    with metrics.span('feature_store'):
+        counts = out.groupby('ticker').size()
+        run_ts = utc_ts()
+        with FeatureStore() as store:
+            store.put_many(
+                row
+                for t, sc in zip(agg['ticker'], agg['score'])
+                for row in (
+                    (t, 'news_score', run_ts, float(sc)),
+                    (t, 'news_count', run_ts, float(counts[t])),
+                    (t, 'news_mean', run_ts, float(max(-3, min(3, sc / counts[t])))),
+                )
+            )
 
     print('Top candidates:')
     print(agg.head(10).to_string(index=False))
@@ -113,4 +176,5 @@ if __name__ == '__main__':
     ap = argparse.ArgumentParser()
     ap.add_argument('--use-llm', type=str, default='false')
     args = ap.parse_args()
-    main(use_llm=args.use_llm.lower() == 'true')
+    with metrics.run('news_alpha'):
+        main(use_llm=args.use_llm.lower() == 'true')
@@ -0,0 +1,268 @@
+import os
+import bz2
+import gzip
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+import threading
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from queue import Empty
+from xml.etree.ElementTree import iterparse
+
+from news_alpha import HTML_TAG_RE, to_utc_iso
+
+DEFAULT_DB = os.getenv('NEWS_ARCHIVE_DB', 'outputs/news_archive.db')
+
+ITEM_TAGS = {'item', 'entry'}
+SUMMARY_TAGS = ('summary', 'description', 'content', 'encoded')
+DATE_TAGS = ('published', 'pubDate', 'updated', 'date')
+DATE_KEYS = ('published', 'pubDate', 'published_at', 'updated', 'date')
+
+# 부모가 큐를 기다리다 워커 상태(비정상 종료 등)를 확인하는 주기(초)
+QUEUE_POLL_SECONDS = 1.0
+
+
+def ensure_db(conn):
+    conn.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS articles (
+            uid TEXT PRIMARY KEY,
+            title TEXT,
+            summary TEXT,
+            link TEXT,
+            published_utc TEXT,
+            source TEXT
+        )
+        '''
+    )
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_utc)')
+    conn.commit()
+
+
+def open_archive(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    if path.endswith('.bz2'):
+        return bz2.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def make_row(title, summary, link, published, source):
+    title = (title or '').strip()
+    link = (link or '').strip()
+    published_utc = to_utc_iso(published)
+    key = link or f'{title}|{published_utc}'
+    uid = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return (uid, title, HTML_TAG_RE.sub('', summary or '').strip(), link, published_utc, source)
+
+
+def _local(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def iter_xml(path):
+    # iterparse로 item/entry 단위만 메모리에 유지하고 처리 후 즉시 해제 (파일 크기와 무관한 메모리)
+    source = os.path.basename(path)
+    with open_archive(path) as f:
+        stack = []
+        for event, elem in iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                stack.append(elem)
+                continue
+            stack.pop()
+            if _local(elem.tag) not in ITEM_TAGS:
+                continue
+
+            fields = {}
+            link = None
+            for child in elem:
+                name = _local(child.tag)
+                if name == 'link':
+                    # Atom: <link href="..."/>, RSS: <link>...</link>
+                    link = link or child.get('href') or (child.text or '')
+                elif name not in fields:
+                    fields[name] = child.text
+            summary = next((fields[t] for t in SUMMARY_TAGS if fields.get(t)), '')
+            published = next((fields[t] for t in DATE_TAGS if fields.get(t)), None)
+            yield make_row(fields.get('title'), summary, link, published, source)
+
+            # 처리한 item은 부모(channel/feed)에서 떼어내 트리가 자라지 않게 한다
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+
+def iter_jsonl(path):
+    source = os.path.basename(path)
+    with open_archive(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                d = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            summary = d.get('summary') or d.get('description') or d.get('content') or ''
+            published = next((d[k] for k in DATE_KEYS if d.get(k)), None)
+            yield make_row(d.get('title'), summary, d.get('link') or d.get('url'), published, source)
+
+
+def iter_archive(path):
+    base = path[:-3] if path.endswith('.gz') else (path[:-4] if path.endswith('.bz2') else path)
+    if base.endswith(('.jsonl', '.ndjson', '.json')):
+        return iter_jsonl(path)
+    return iter_xml(path)
+
+
+def insert_batch(conn, rows):
+    # 배치 하나 = 트랜잭션 하나. uid 충돌(중복 기사)은 무시
+    before = conn.total_changes
+    with conn:
+        conn.executemany(
+            'INSERT OR IGNORE INTO articles(uid,title,summary,link,published_utc,source) VALUES(?,?,?,?,?,?)',
+            rows,
+        )
+    return conn.total_changes - before
+
+
+_QUEUE = None
+_STOP = None
+
+
+def _init_worker(queue, stop):
+    global _QUEUE, _STOP
+    _QUEUE = queue
+    _STOP = stop
+
+
+def _parse_to_queue(path, batch_size):
+    n = 0
+    batch = []
+    try:
+        for row in iter_archive(path):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                if _STOP.is_set():
+                    # 부모가 중단했으면 더 파싱하지 않고 종료
+                    return n
+                _QUEUE.put(batch)
+                n += len(batch)
+                batch = []
+        if batch and not _STOP.is_set():
+            _QUEUE.put(batch)
+            n += len(batch)
+    finally:
+        # 예외가 나도 부모가 기다리지 않도록 종료 표시는 항상 보낸다
+        _QUEUE.put(None)
+    return n
+
+
+def _raise_if_failed(futures):
+    # 워커가 죽으면(OOM, kill) 종료 표시가 오지 않으므로 future 상태로 확인 (BrokenProcessPool 등)
+    for fut in futures:
+        if fut.done() and not fut.cancelled() and fut.exception() is not None:
+            raise fut.exception()
+
+
+def _abort(ex, futures, queue, stop):
+    # 워커는 가득 찬 큐의 put(또는 종료 시 큐 flush)에서 막혀 있을 수 있으므로,
+    # 중단 표시 후 풀이 내려갈 때까지 큐를 계속 비워 준다
+    stop.set()
+    for fut in futures:
+        fut.cancel()
+    closer = threading.Thread(target=ex.shutdown, kwargs={'wait': True, 'cancel_futures': True})
+    closer.start()
+    while closer.is_alive():
+        try:
+            queue.get(timeout=0.1)
+        except Empty:
+            pass
+        except (OSError, EOFError):
+            # Manager 프로세스가 먼저 죽었으면 워커의 put도 실패하므로 더 비울 필요가 없다
+            break
+    closer.join()
+
+
+def _write_from_workers(conn, paths, workers, batch_size):
+    # 파일 단위로 프로세스 병렬 파싱, SQLite 쓰기는 부모 한 곳에서만 (bounded queue로 메모리 상한)
+    # mp.Queue는 모든 워커가 파이프 하나를 공유해, 쓰는 도중 죽은 워커가 반쯤 쓴 메시지에서 부모 get이 영원히 멈춘다.
+    # Manager 큐는 워커마다 연결이 따로라 워커가 죽어도 부모 쪽 조회는 timeout으로 돌아온다
+    ctx = mp.get_context()
+    manager = ctx.Manager()
+    queue = manager.Queue(maxsize=workers * 2)
+    stop = ctx.Event()
+    ex = ProcessPoolExecutor(workers, mp_context=ctx, initializer=_init_worker, initargs=(queue, stop))
+    futures = []
+    parsed = inserted = 0
+    try:
+        futures = [ex.submit(_parse_to_queue, p, batch_size) for p in paths]
+        done = 0
+        while done < len(paths):
+            try:
+                batch = queue.get(timeout=QUEUE_POLL_SECONDS)
+            except Empty:
+                _raise_if_failed(futures)
+                continue
+            if batch is None:
+                done += 1
+                continue
+            inserted += insert_batch(conn, batch)
+            parsed += len(batch)
+        for fut in futures:
+            fut.result()
+    except BaseException:
+        _abort(ex, futures, queue, stop)
+        raise
+    finally:
+        manager.shutdown()
+    ex.shutdown(wait=True)
+    return parsed, inserted
+
+
+def backfill(paths, db_path=DEFAULT_DB, workers=None, batch_size=50_000):
+    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    ensure_db(conn)
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths)))
+    parsed = inserted = 0
+    t0 = time.perf_counter()
+    try:
+        if workers == 1:
+            for path in paths:
+                batch = []
+                for row in iter_archive(path):
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        inserted += insert_batch(conn, batch)
+                        parsed += len(batch)
+                        batch = []
+                if batch:
+                    inserted += insert_batch(conn, batch)
+                    parsed += len(batch)
+        else:
+            parsed, inserted = _write_from_workers(conn, paths, workers, batch_size)
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - t0
+    rate = parsed / elapsed if elapsed > 0 else float('nan')
+    print(f'Parsed {parsed:,} entries from {len(paths)} files in {elapsed:.1f}s ({rate:,.0f}/s)')
+    print(f'Inserted {inserted:,} new articles ({parsed - inserted:,} duplicates) into {db_path}')
+    return {'parsed': parsed, 'inserted': inserted, 'seconds': elapsed}
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('paths', nargs='+', help='RSS/Atom XML or JSONL archives (.gz/.bz2 ok)')
+    ap.add_argument('--db', default=DEFAULT_DB)
+    ap.add_argument('--workers', type=int, default=None, help='parser processes (default: cpu count)')
+    ap.add_argument('--batch-size', type=int, default=50_000, help='rows per insert transaction')
+    args = ap.parse_args()
+    backfill(args.paths, db_path=args.db, workers=args.workers, batch_size=args.batch_size)